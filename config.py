@@ -23,9 +23,21 @@ SHORT_MIN_LENGTH = 25
 DETAILED_MAX_LENGTH = 150
 DETAILED_MIN_LENGTH = 60
 
+# Beam widths per level (greedy alert; short and detailed share 4 beams so they
+# are decoded in one batch) are set in SUMMARY_LEVELS in src/models/summarizer.py
+
 # Processing Configuration
 USE_GPU = True  # Automatically uses GPU if available
-MAX_INPUT_LENGTH = 1024  # Maximum tokens for input text
+# Torch runtime defaults (set once when src/models/summarizer.py is imported):
+# - TF32 matmuls/convs on Ampere+ GPUs: FP32 API with ~10-bit mantissa products,
+#   negligible drift for inference, several times the FP32 matmul throughput
+# - cudnn.benchmark: slower first call while kernels are autotuned, faster afterwards
+# - CPU intra-op threads capped at 4: less contention with the web server on shared
+#   hosts, at the cost of peak single-request speed on large dedicated CPUs
+PRECISION = "auto"  # GPU weight precision: auto (bf16 on Ampere+, else fp16), fp16, bf16, fp32, or int8 (bitsandbytes; on CPU int8 ONNX Runtime, or PyTorch dynamic int8 without it). CPU otherwise runs fp32
+COMPILE = False  # Compile the decoder with torch.compile (PyTorch 2.x); slower first request, faster decoding after
+USE_ORT = False  # Run an ONNX Runtime export (pip install .[ort]): int8-quantized on CPU, CUDA EP + I/O binding on GPU
+MAX_INPUT_LENGTH = 1024  # BART input budget in tokens (the summarizer reads the exact limit from the loaded model); longer reports are summarized in overlapping chunks first
 
 # Streamlit UI Configuration
 PAGE_TITLE = "Voice Disaster Report Summarizer"
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.pipeline import voice_to_summary
 from src.models.speech_to_text import transcribe_audio
 from src.models.summarizer import generate_all_summaries
+from src.utils.logging_config import setup_logging
 
 
 def example_text_summarization():
@@ -93,6 +94,7 @@ def example_full_pipeline(audio_file: str):
 
 
 if __name__ == "__main__":
+    setup_logging()
     print("🎙️ Voice-Enabled Disaster Report Summarization System")
     print("Example Usage Script\n")
     
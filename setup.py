@@ -21,9 +21,9 @@ setup(
     packages=find_packages(),
     install_requires=[
         "torch>=2.0.0",
-        "transformers>=4.30.0",
+        "transformers>=4.52.1",
         "streamlit>=1.28.0",
-        "openai-whisper>=20231117",
+        "faster-whisper>=1.0.0",
         "sounddevice>=0.4.6",
         "scipy>=1.10.0",
         "rouge-score>=0.1.2",
@@ -33,6 +33,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
         ],
@@ -40,8 +41,19 @@ setup(
             "pydub>=0.25.1",
             "ffmpeg-python>=0.2.0",
         ],
+        "ort": [
+            "optimum[onnxruntime]>=1.18",
+            "onnxruntime>=1.17",
+        ],
+        "int8": [
+            "bitsandbytes>=0.41.0",
+            "accelerate>=0.20.0",
+        ],
+        "fast-rouge": [
+            "numba>=0.57.0",
+        ],
     },
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
@@ -49,7 +61,6 @@ setup(
         "Topic :: Text Processing :: Linguistic",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
@@ -1,13 +1,24 @@
 """
 Models package: Summarization and Structured Reports
+
+Exports are imported on first access, so importing a single submodule
+(e.g. speech_to_text) does not load torch and transformers.
 """
 
-from .summarizer import DisasterSummarizer, generate_all_summaries
-from .structured_report import StructuredReportGenerator
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'DisasterSummarizer': 'summarizer',
+    'generate_all_summaries': 'summarizer',
+    'get_summarizer': 'summarizer',
+    'StructuredReportGenerator': 'structured_report',
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    'DisasterSummarizer',
-    'generate_all_summaries',
-    'StructuredReportGenerator'
-]
 
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
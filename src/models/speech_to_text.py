@@ -1,115 +1,238 @@
 """
-Speech-to-Text Module using OpenAI Whisper
+Speech-to-Text Module using Whisper (faster-whisper / CTranslate2 backend)
 Handles audio transcription for disaster reports
 """
 
-import whisper
-import os
-import tempfile
-from typing import Optional
+import ctranslate2
+from faster_whisper import WhisperModel, decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Whisper operates on 16 kHz audio in 30-second windows
+_SAMPLE_RATE = 16000
+_CHUNK_SECONDS = 30
+
 
 class SpeechToText:
-    """Wrapper class for Whisper speech recognition"""
+    """Wrapper class for Whisper speech recognition (CTranslate2 backend)"""
     
-    def __init__(self, model_size: str = "base"):
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        num_workers: int = 1,
+        device_index: Union[int, List[int]] = 0
+    ):
         """
         Initialize Whisper model
         
         Args:
             model_size: Whisper model size (tiny, base, small, medium, large)
                        Default: 'base' for good balance of speed and accuracy
+            device: "cuda" or "cpu". Default: CUDA when a GPU is visible to CTranslate2
+            compute_type: CTranslate2 weight/compute type (e.g. "float16", "int8_float16",
+                          "int8"). Default: float16 on GPU, int8 on CPU
+            num_workers: Model replicas per device, so that transcriptions issued from
+                         several threads (see transcribe_audio_parallel) run in parallel
+            device_index: GPU id, or a list of ids to spread the workers over several GPUs
         """
-        logger.info(f"Loading Whisper model: {model_size}")
-        self.model = whisper.load_model(model_size)
+        if device is None:
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if compute_type is None:
+            # FP16 runs on tensor cores; int8 weights halve memory and use VNNI GEMMs on CPU
+            compute_type = "float16" if device == "cuda" else "int8"
+        
+        logger.info("Loading Whisper model: %s (%s, %s)", model_size, device, compute_type)
+        self.model = WhisperModel(
+            model_size,
+            device=device,
+            device_index=device_index,
+            compute_type=compute_type,
+            num_workers=num_workers
+        )
         self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        n_devices = len(device_index) if isinstance(device_index, list) and device == "cuda" else 1
+        self.num_workers = num_workers * n_devices
         logger.info("Whisper model loaded successfully")
     
-    def transcribe_audio(self, audio_path: str, language: Optional[str] = None) -> str:
+    def transcribe_audio(
+        self,
+        audio_path: Union[str, BinaryIO],
+        language: Optional[str] = None
+    ) -> str:
         """
         Transcribe audio file to text
         
         Args:
-            audio_path: Path to audio file (wav, mp3, etc.)
+            audio_path: Path to audio file (wav, mp3, etc.) or a binary file-like
+                        object (e.g. a Streamlit UploadedFile), decoded in-process
             language: Optional language code (e.g., 'en'). Auto-detected if None
             
         Returns:
             Transcribed text string
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-        
-        logger.info(f"Transcribing audio: {audio_path}")
+        logger.info("Transcribing audio: %s", getattr(audio_path, "name", audio_path))
         
         try:
             # Transcribe with optional language specification
-            result = self.model.transcribe(
+            # Greedy decoding; the VAD filter skips silent stretches before the encoder.
+            # Not conditioning on the previous window stops hallucinations from cascading.
+            segments, _info = self.model.transcribe(
                 audio_path,
                 language=language,
-                task="transcribe"
+                task="transcribe",
+                beam_size=1,
+                condition_on_previous_text=False,
+                no_speech_threshold=0.6,
+                compression_ratio_threshold=2.4,
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500)
             )
             
-            text = result["text"].strip()
-            logger.info(f"Transcription completed. Length: {len(text)} characters")
+            # Segments are decoded lazily while iterating
+            text = "".join(segment.text for segment in segments).strip()
+            logger.info("Transcription completed. Length: %d characters", len(text))
             
             return text
             
-        except FileNotFoundError as e:
-            # Check if it's an FFmpeg-related error
-            error_msg = str(e)
-            if "ffmpeg" in error_msg.lower() or "The system cannot find the file specified" in error_msg:
-                logger.error("FFmpeg not found. Whisper requires FFmpeg to process audio files.")
-                raise FileNotFoundError(
-                    "FFmpeg is not installed or not in PATH. "
-                    "Please install FFmpeg:\n"
-                    "- Windows: Download from https://ffmpeg.org/download.html or use 'choco install ffmpeg'\n"
-                    "- Linux: 'sudo apt-get install ffmpeg'\n"
-                    "- macOS: 'brew install ffmpeg'"
-                ) from e
-            else:
-                logger.error(f"File not found: {error_msg}")
-                raise
+        except FileNotFoundError:
+            # Raised by the decoder when opening the path; no separate stat up front
+            raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
         except Exception as e:
-            logger.error(f"Error during transcription: {str(e)}")
-            # Check if it's an FFmpeg-related error in the exception message
-            error_msg = str(e).lower()
-            if "ffmpeg" in error_msg or "cannot find the file" in error_msg:
-                raise FileNotFoundError(
-                    "FFmpeg is not installed or not in PATH. "
-                    "Please install FFmpeg:\n"
-                    "- Windows: Download from https://ffmpeg.org/download.html or use 'choco install ffmpeg'\n"
-                    "- Linux: 'sudo apt-get install ffmpeg'\n"
-                    "- macOS: 'brew install ffmpeg'"
-                ) from e
+            logger.error("Error during transcription: %s", e)
             raise
     
+    def transcribe_audio_parallel(
+        self,
+        audio_path: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        num_workers: Optional[int] = None
+    ) -> str:
+        """
+        Transcribe long recordings by decoding speech chunks concurrently
+        
+        The audio is decoded once, split at Silero VAD speech boundaries into
+        chunks of up to ~30 s (Whisper's window), and the chunks are transcribed
+        on a thread pool. CTranslate2 releases the GIL during inference, so with
+        num_workers model replicas the chunks decode in parallel. Text is joined
+        in chunk order.
+        
+        Args:
+            audio_path: Path to audio file or a binary file-like object
+            language: Optional language code. Detected once on the first chunk if None,
+                      so every chunk is decoded in the same language
+            num_workers: Concurrent chunks. Default: the model's worker count
+            
+        Returns:
+            Transcribed text string
+        """
+        try:
+            audio = decode_audio(audio_path, sampling_rate=_SAMPLE_RATE)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
+        speech = get_speech_timestamps(
+            audio, VadOptions(max_speech_duration_s=_CHUNK_SECONDS, min_silence_duration_ms=500)
+        )
+        
+        # Merge consecutive speech regions while they fit into one Whisper window
+        chunks = []
+        for region in speech:
+            if chunks and region["end"] - chunks[-1][0] <= _CHUNK_SECONDS * _SAMPLE_RATE:
+                chunks[-1][1] = region["end"]
+            else:
+                chunks.append([region["start"], region["end"]])
+        if not chunks:
+            return ""
+        
+        if language is None:
+            first_start, first_end = chunks[0]
+            language, _probability, _all = self.model.detect_language(audio[first_start:first_end])
+        
+        logger.info("Transcribing %d speech chunks in parallel (language: %s)", len(chunks), language)
+        
+        def transcribe_chunk(bounds) -> str:
+            start, end = bounds
+            segments, _info = self.model.transcribe(
+                audio[start:end],
+                language=language,
+                task="transcribe",
+                beam_size=1,
+                condition_on_previous_text=False,
+                no_speech_threshold=0.6,
+                compression_ratio_threshold=2.4
+            )
+            return "".join(segment.text for segment in segments).strip()
+        
+        with ThreadPoolExecutor(max_workers=num_workers or self.num_workers) as executor:
+            texts = list(executor.map(transcribe_chunk, chunks))
+        
+        text = " ".join(chunk_text for chunk_text in texts if chunk_text)
+        logger.info("Transcription completed. Length: %d characters", len(text))
+        return text
+    
     def transcribe_from_bytes(self, audio_bytes: bytes, temp_suffix: str = ".wav") -> str:
         """
         Transcribe audio from bytes (useful for Streamlit file uploads)
         
         Args:
             audio_bytes: Audio file as bytes
-            temp_suffix: File extension for temporary file
+            temp_suffix: Unused; kept for backwards compatibility (the container
+                         format is detected from the data itself)
             
         Returns:
             Transcribed text string
         """
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=temp_suffix) as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_path = tmp_file.name
+        # Decoded straight from memory, no temporary file round-trip
+        return self.transcribe_audio(io.BytesIO(audio_bytes))
+
+
+# Loaded models, shared by every caller in the process
+_MODEL_CACHE: Dict[Tuple[str, Optional[str], Optional[str], int], SpeechToText] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def get_stt_model(
+    model_size: str = "base",
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    num_workers: int = 1
+) -> SpeechToText:
+    """
+    Return the process-wide SpeechToText for these settings, loading it on first use
+    
+    Args:
+        model_size: Whisper model size
+        device: Optional device override (see SpeechToText)
+        compute_type: Optional compute type override (see SpeechToText)
+        num_workers: Model replicas for parallel transcription (see SpeechToText)
         
-        try:
-            text = self.transcribe_audio(tmp_path)
-            return text
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+    Returns:
+        Cached SpeechToText instance
+    """
+    key = (model_size, device, compute_type, num_workers)
+    stt = _MODEL_CACHE.get(key)
+    if stt is None:
+        with _MODEL_CACHE_LOCK:
+            # Another thread may have loaded it while we waited for the lock
+            stt = _MODEL_CACHE.get(key)
+            if stt is None:
+                stt = SpeechToText(
+                    model_size=model_size,
+                    device=device,
+                    compute_type=compute_type,
+                    num_workers=num_workers
+                )
+                _MODEL_CACHE[key] = stt
+    return stt
 
 
 # Convenience function for direct use
@@ -125,13 +248,17 @@ def transcribe_audio(audio_path: str, model_size: str = "base", language: Option
     Returns:
         Transcribed text
     """
-    stt = SpeechToText(model_size=model_size)
-    return stt.transcribe_audio(audio_path, language=language)
+    return get_stt_model(model_size).transcribe_audio(audio_path, language=language)
 
 
 if __name__ == "__main__":
     # Test the module
     import sys
+    from pathlib import Path
+    
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from utils.logging_config import setup_logging
+    setup_logging()
     
     if len(sys.argv) > 1:
         audio_file = sys.argv[1]
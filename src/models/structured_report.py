@@ -3,25 +3,86 @@ Structured Disaster Report Generator
 Converts standard summaries into structured, abstractive disaster reports
 """
 
-from typing import Tuple
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+import hashlib
 import logging
-import sys
+import re
+import threading
 from datetime import datetime
 from .summarizer import DisasterSummarizer
 
-# Setup logging with clear format
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)-8s %(message)s',
-    datefmt='%H:%M:%S',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
 logger = logging.getLogger(__name__)
 
+# Disaster type keywords, highest priority first (substring match, case-insensitive)
+_DISASTER_KEYWORDS = (
+    ("earthquake", ("earthquake", "seismic", "tremor", "richter")),
+    ("flood", ("flood", "flooding", "inundation", "water")),
+    ("cyclone", ("cyclone", "hurricane", "typhoon", "storm")),
+    ("wildfire", ("wildfire", "fire", "blaze", "burning")),
+    ("tsunami", ("tsunami", "tidal wave")),
+    ("drought", ("drought", "dry", "water shortage")),
+)
+_DISASTER_PRIORITY = [disaster_type for disaster_type, _ in _DISASTER_KEYWORDS]
+# One alternation over every keyword; the zero-width lookahead reports a match at
+# each position, so keywords overlapping an earlier match are still seen
+_DISASTER_TYPE_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{disaster_type}>{'|'.join(map(re.escape, keywords))})"
+        for disaster_type, keywords in _DISASTER_KEYWORDS
+    ) + ")",
+    re.IGNORECASE,
+)
+
+# Structured report sections, in report order:
+# (section, header, question, max_length, min_length)
+_SECTION_SPEC = (
+    # Introduction (What, When, Where) - Focus on basic facts only
+    ("introduction", "**INTRODUCTION (What, When, Where)**",
+     "What type of disaster, when did it occur, and where? Answer ONLY these three questions in 2-3 sentences. "
+     "Do not describe how it happened or its impact.", 80, 30),
+    # Details (How) - Focus on sequence and mechanism
+    ("details", "**DETAILS OF THE EVENT (How)**",
+     "How did this disaster develop and progress? Describe the sequence, intensity changes, weather conditions, "
+     "and physical processes. Do NOT mention what/when/where or casualties.", 100, 40),
+    # Impact & Damage - Focus on numbers and specific damage
+    ("impact", "**IMPACT & DAMAGE (Figures & Facts)**",
+     "What are the human casualties, injuries, deaths, displaced people, and damage to buildings and "
+     "infrastructure? Extract ONLY numbers and damage facts. Use 'according to reports' or 'preliminary "
+     "estimates'. If no numbers, say 'assessment ongoing'. Do NOT describe the disaster event.", 100, 40),
+    # Response & Relief - Focus on actions taken
+    ("response", "**RESPONSE & RELIEF EFFORTS**",
+     "What rescue operations, emergency services, government actions, relief efforts, and aid were deployed? "
+     "Extract ONLY response actions. Do NOT describe the disaster or impact.", 80, 30),
+    # Aftermath & Lessons - Focus on future implications
+    ("aftermath", "**AFTERMATH & LESSONS LEARNED**",
+     "What are the ongoing risks, recovery challenges, and lessons about preparedness or early warning systems? "
+     "Focus on future implications. If not mentioned, briefly note recovery will be challenging. "
+     "Do NOT repeat disaster or response details.", 80, 30),
+)
+
+# Generated titles kept per generator (LRU), keyed by report opening + disaster type
+_TITLE_CACHE_SIZE = 256
+
+# Runs of 3+ newlines, collapsed to one blank line when post-processing reports
+_MULTI_NL = re.compile(r"\n{3,}")
+
 
 class StructuredReportGenerator:
     """Generates structured disaster reports with specific sections"""
     
+    # Section markers -> canonical headers, used to format free-form reports consistently
+    _SECTIONS_MAP = {
+        "TITLE": "**TITLE & BYLINE**",
+        "BYLINE": "**TITLE & BYLINE**",
+        "INTRODUCTION": "**INTRODUCTION (What, When, Where)**",
+        "DETAILS": "**DETAILS OF THE EVENT (How)**",
+        "IMPACT": "**IMPACT & DAMAGE (Figures & Facts)**",
+        "RESPONSE": "**RESPONSE & RELIEF EFFORTS**",
+        "AFTERMATH": "**AFTERMATH & LESSONS LEARNED**",
+        "LESSONS": "**AFTERMATH & LESSONS LEARNED**"
+    }
+    
     def __init__(self, summarizer: DisasterSummarizer):
         """
         Initialize with an existing summarizer
@@ -30,6 +91,8 @@ class StructuredReportGenerator:
             summarizer: DisasterSummarizer instance
         """
         self.summarizer = summarizer
+        self._title_cache = OrderedDict()
+        self._title_cache_lock = threading.Lock()
     
     def _create_structured_prompt(self, text: str) -> str:
         """
@@ -88,22 +151,13 @@ Now generate the structured report following the format above:"""
         Returns:
             Disaster type string
         """
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ['earthquake', 'seismic', 'tremor', 'richter']):
-            return "earthquake"
-        elif any(word in text_lower for word in ['flood', 'flooding', 'inundation', 'water']):
-            return "flood"
-        elif any(word in text_lower for word in ['cyclone', 'hurricane', 'typhoon', 'storm']):
-            return "cyclone"
-        elif any(word in text_lower for word in ['wildfire', 'fire', 'blaze', 'burning']):
-            return "wildfire"
-        elif any(word in text_lower for word in ['tsunami', 'tidal wave']):
-            return "tsunami"
-        elif any(word in text_lower for word in ['drought', 'dry', 'water shortage']):
-            return "drought"
-        else:
-            return "disaster"
+        # Single pass over the text; the highest-priority type mentioned anywhere wins
+        best = len(_DISASTER_PRIORITY)
+        for match in _DISASTER_TYPE_RE.finditer(text):
+            best = min(best, _DISASTER_PRIORITY.index(match.lastgroup))
+            if best == 0:
+                break
+        return _DISASTER_PRIORITY[best] if best < len(_DISASTER_PRIORITY) else "disaster"
     
     def generate_structured_report(self, text: str) -> str:
         """
@@ -116,80 +170,68 @@ Now generate the structured report following the format above:"""
             Structured disaster report string
         """
         text_length = len(text)
-        logger.info(f"[STRUCTURED REPORT] Starting structured disaster report generation (input: {text_length} characters)")
+        logger.info("[STRUCTURED REPORT] Starting structured disaster report generation (input: %d characters)", text_length)
         
         current_date = datetime.now().strftime("%B %d, %Y")
         disaster_type = self._detect_disaster_type(text)
-        logger.info(f"[STRUCTURED REPORT] Detected disaster type: {disaster_type.upper()}")
-        
-        # Generate title first
-        logger.info("[STRUCTURED REPORT] Step 1/6: Generating Title & Byline...")
-        title_prompt = f"Create a concise, professional title for this {disaster_type} disaster report: {text[:200]}"
-        title = self.summarizer.generate_summary(title_prompt, max_length=15, min_length=5)
-        title = title.strip().rstrip('.')
-        logger.info(f"[STRUCTURED REPORT] ✓ Title generated: '{title}'")
-        
-        # Generate each section separately for better control
-        sections = {}
+        logger.info("[STRUCTURED REPORT] Detected disaster type: %s", disaster_type.upper())
+        
+        names = [name for name, *_ in _SECTION_SPEC]
+        prompts = [f"Question: {question} Text: {text}" for _, _, question, _, _ in _SECTION_SPEC]
+        max_lengths = [max_length for _, _, _, max_length, _ in _SECTION_SPEC]
+        min_lengths = [min_length for _, _, _, _, min_length in _SECTION_SPEC]
+        
+        # Title & Byline - short headline from the opening of the report,
+        # decoded in the same batch as the sections unless it is already cached
+        title_key = (hashlib.blake2b(text[:200].encode("utf-8"), digest_size=16).hexdigest(), disaster_type)
+        with self._title_cache_lock:
+            title = self._title_cache.get(title_key)
+            if title is not None:
+                self._title_cache.move_to_end(title_key)
+        if title is None:
+            names.insert(0, 'title')
+            prompts.insert(0, f"Create a concise, professional title for this {disaster_type} disaster report: {text[:200]}")
+            max_lengths.insert(0, 15)
+            min_lengths.insert(0, 5)
+        
+        logger.info("[STRUCTURED REPORT] Steps 1-6/6: Generating Title, Introduction, Details, Impact, Response and Aftermath sections in one batch...")
+        # One beam width for every row: left to the length-based default, the
+        # 15-token title would decode greedily in a generate call of its own
+        outputs = self.summarizer.generate_summary_batch(
+            prompts, max_length=max_lengths, min_length=min_lengths,
+            num_beams=self.summarizer.generation_config.num_beams
+        )
+        sections = dict(zip(names, outputs))
+        
+        if title is None:
+            title = sections.pop('title').strip().rstrip('.')
+            # Failed generations are not cached, so the next request retries them
+            if not title.startswith("Error generating summary"):
+                with self._title_cache_lock:
+                    self._title_cache[title_key] = title
+                    if len(self._title_cache) > _TITLE_CACHE_SIZE:
+                        self._title_cache.popitem(last=False)
+            logger.info("[STRUCTURED REPORT] ✓ Title generated: '%s'", title)
+        else:
+            logger.info("[STRUCTURED REPORT] ✓ Title reused from cache: '%s'", title)
         
-        # Introduction (What, When, Where) - Focus on basic facts only
-        logger.info("[STRUCTURED REPORT] Step 2/6: Generating Introduction (What, When, Where)...")
-        intro_prompt = f"Question: What type of disaster, when did it occur, and where? Answer ONLY these three questions in 2-3 sentences. Do not describe how it happened or its impact. Text: {text}"
-        sections['introduction'] = self.summarizer.generate_summary(intro_prompt, max_length=80, min_length=30)
         # Clean up to ensure it's different
         if sections['introduction'].lower().startswith('a powerful'):
             sections['introduction'] = sections['introduction'].replace('A powerful', 'The disaster', 1)
-        logger.info(f"[STRUCTURED REPORT] ✓ Introduction generated ({len(sections['introduction'])} characters)")
-        
-        # Details (How) - Focus on sequence and mechanism
-        logger.info("[STRUCTURED REPORT] Step 3/6: Generating Details of the Event (How)...")
-        details_prompt = f"Question: How did this disaster develop and progress? Describe the sequence, intensity changes, weather conditions, and physical processes. Do NOT mention what/when/where or casualties. Text: {text}"
-        sections['details'] = self.summarizer.generate_summary(details_prompt, max_length=100, min_length=40)
-        logger.info(f"[STRUCTURED REPORT] ✓ Event details generated ({len(sections['details'])} characters)")
-        
-        # Impact & Damage - Focus on numbers and specific damage
-        logger.info("[STRUCTURED REPORT] Step 4/6: Generating Impact & Damage section...")
-        impact_prompt = f"Question: What are the human casualties, injuries, deaths, displaced people, and damage to buildings and infrastructure? Extract ONLY numbers and damage facts. Use 'according to reports' or 'preliminary estimates'. If no numbers, say 'assessment ongoing'. Do NOT describe the disaster event. Text: {text}"
-        sections['impact'] = self.summarizer.generate_summary(impact_prompt, max_length=100, min_length=40)
-        logger.info(f"[STRUCTURED REPORT] ✓ Impact & Damage section generated ({len(sections['impact'])} characters)")
-        
-        # Response & Relief - Focus on actions taken
-        logger.info("[STRUCTURED REPORT] Step 5/6: Generating Response & Relief Efforts section...")
-        response_prompt = f"Question: What rescue operations, emergency services, government actions, relief efforts, and aid were deployed? Extract ONLY response actions. Do NOT describe the disaster or impact. Text: {text}"
-        sections['response'] = self.summarizer.generate_summary(response_prompt, max_length=80, min_length=30)
-        logger.info(f"[STRUCTURED REPORT] ✓ Response & Relief section generated ({len(sections['response'])} characters)")
-        
-        # Aftermath & Lessons - Focus on future implications
-        logger.info("[STRUCTURED REPORT] Step 6/6: Generating Aftermath & Lessons Learned section...")
-        aftermath_prompt = f"Question: What are the ongoing risks, recovery challenges, and lessons about preparedness or early warning systems? Focus on future implications. If not mentioned, briefly note recovery will be challenging. Do NOT repeat disaster or response details. Text: {text}"
-        sections['aftermath'] = self.summarizer.generate_summary(aftermath_prompt, max_length=80, min_length=30)
-        logger.info(f"[STRUCTURED REPORT] ✓ Aftermath & Lessons section generated ({len(sections['aftermath'])} characters)")
+        for name, header, *_ in _SECTION_SPEC:
+            logger.info("[STRUCTURED REPORT] ✓ %s generated (%d characters)", header.strip("*"), len(sections[name]))
         
         # Post-process sections to ensure they're distinct
         sections = self._ensure_section_diversity(sections)
         
         # Assemble structured report
-        structured_report = f"""**TITLE & BYLINE**
-{title}
-Disaster Assessment Report | Generated on {current_date}
-
-**INTRODUCTION (What, When, Where)**
-{sections['introduction']}
-
-**DETAILS OF THE EVENT (How)**
-{sections['details']}
-
-**IMPACT & DAMAGE (Figures & Facts)**
-{sections['impact']}
-
-**RESPONSE & RELIEF EFFORTS**
-{sections['response']}
-
-**AFTERMATH & LESSONS LEARNED**
-{sections['aftermath']}"""
+        structured_report = "\n\n".join(
+            [f"**TITLE & BYLINE**\n{title}\nDisaster Assessment Report | Generated on {current_date}"]
+            + [f"{header}\n{sections[name]}" for name, header, *_ in _SECTION_SPEC]
+        )
         
         total_length = len(structured_report)
-        logger.info(f"[STRUCTURED REPORT] ✓ Structured disaster report generated successfully ({total_length} characters, 6 sections)")
+        logger.info("[STRUCTURED REPORT] ✓ Structured disaster report generated successfully (%d characters, 6 sections)", total_length)
         return structured_report
     
     def _ensure_section_diversity(self, sections: dict) -> dict:
@@ -244,19 +286,6 @@ Disaster Assessment Report | Generated on {current_date}
         # Clean up the report
         report = report.strip()
         
-        # Ensure proper section formatting
-        # Look for section markers and format them consistently
-        sections_map = {
-            "TITLE": "**TITLE & BYLINE**",
-            "BYLINE": "**TITLE & BYLINE**",
-            "INTRODUCTION": "**INTRODUCTION (What, When, Where)**",
-            "DETAILS": "**DETAILS OF THE EVENT (How)**",
-            "IMPACT": "**IMPACT & DAMAGE (Figures & Facts)**",
-            "RESPONSE": "**RESPONSE & RELIEF EFFORTS**",
-            "AFTERMATH": "**AFTERMATH & LESSONS LEARNED**",
-            "LESSONS": "**AFTERMATH & LESSONS LEARNED**"
-        }
-        
         lines = report.split('\n')
         formatted_lines = []
         last_section = None
@@ -269,12 +298,13 @@ Disaster Assessment Report | Generated on {current_date}
                 
             line_upper = line_stripped.upper()
             
-            # Check if this line is a section header
+            # Check if this line is a section header (short lines only are likely headers)
             section_found = None
-            for key, section_name in sections_map.items():
-                if key in line_upper and (len(line_stripped) < 100):  # Likely a header
-                    section_found = section_name
-                    break
+            if len(line_stripped) < 100:
+                section_found = next(
+                    (section_name for key, section_name in self._SECTIONS_MAP.items() if key in line_upper),
+                    None
+                )
             
             if section_found and section_found != last_section:
                 formatted_lines.append('')  # Add spacing before section
@@ -287,8 +317,7 @@ Disaster Assessment Report | Generated on {current_date}
         result = '\n'.join(formatted_lines)
         
         # Clean up excessive newlines (more than 2 consecutive)
-        import re
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        result = _MULTI_NL.sub('\n\n', result)
         
         # Ensure title and byline are at the top
         if "**TITLE & BYLINE**" not in result:
@@ -300,20 +329,26 @@ Disaster Assessment Report | Generated on {current_date}
     
     def generate_all_summaries_with_structured_report(
         self, 
-        text: str
+        text: str,
+        on_update: Optional[Callable[[str, str], None]] = None
     ) -> Tuple[str, str, str]:
         """
         Generate Alert, Short, and Structured Detailed Report
         
         Args:
             text: Input disaster report text
+            on_update: Optional callback `on_update(level, text)` receiving the
+                       alert and short summaries as they are generated
             
         Returns:
             Tuple of (alert, short_summary, structured_detailed_report)
         """
         logger.info("[PIPELINE] Generating Alert and Short summaries (standard format)...")
-        # Generate standard alert and short summaries (unchanged)
-        alert, short, _ = self.summarizer.generate_all_summaries(text)
+        # Generate standard alert and short summaries only; the structured report
+        # below replaces the detailed summary, so it is never generated
+        alert, short = self.summarizer.generate_level_summaries(
+            text, levels=("alert", "short"), on_update=on_update
+        )
         logger.info("[PIPELINE] ✓ Alert and Short summaries completed")
         
         # Generate structured detailed report
@@ -3,23 +3,96 @@ Text Summarization Module using T5 and BART Transformers
 Generates multi-level summaries for disaster reports
 """
 
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+from transformers import (
+    AutoTokenizer, AutoModelForSeq2SeqLM, BitsAndBytesConfig, LogitsProcessor, LogitsProcessorList,
+    TextIteratorStreamer
+)
+from transformers.utils import is_flash_attn_2_available
 import torch
-from typing import Tuple, Optional, Literal
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Optional, Literal, Union
+from collections import OrderedDict
 from enum import Enum
+import asyncio
+import copy
+import functools
+import hashlib
+import importlib.util
 import logging
+import os
 import sys
+import threading
 from pathlib import Path
 
-# Setup logging with clear format
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)-8s %(message)s',
-    datefmt='%H:%M:%S',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+
+def _module_available(name: str) -> bool:
+    """Whether a module can be found, without importing it (or only its parent package)"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Optional backends are only detected here; optimum / bitsandbytes take seconds to
+# import and are loaded by the code paths that use them
+ORT_AVAILABLE = _module_available("onnxruntime") and _module_available("optimum.onnxruntime")
+BNB_AVAILABLE = _module_available("bitsandbytes")
+
+# Let residual FP32 matmuls and convolutions use TF32 tensor cores on GPUs that support them
+torch.set_float32_matmul_precision("high")
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+# Autotune cuDNN kernels on first use (fixed-shape workloads)
+torch.backends.cudnn.benchmark = True
+# Cap intra-op threads so CPU inference does not contend with the Streamlit server threads
+torch.set_num_threads(min(4, os.cpu_count() or 1))
+
 logger = logging.getLogger(__name__)
 
+# Weight dtypes used on GPU; CPU inference always stays in FP32
+_GPU_DTYPES = {
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+    "fp32": torch.float32,
+}
+# int8 weights: bitsandbytes LLM.int8() on GPU (FP16 activations), int8 ONNX Runtime on CPU
+# "auto": bf16 on Ampere+ (same range as fp32, no overflow), fp16 on older GPUs
+_PRECISIONS = ("auto", *_GPU_DTYPES, "int8")
+# Environment override for precision="auto" (e.g. int8 for the test suite, see tests/conftest.py)
+_PRECISION_ENV = "DISASTER_SUMM_QUANT"
+
+# Input budget for models whose tokenizer/config state no limit; the real budget
+# is read from the model at load time. Longer reports are condensed chunk by chunk
+_MAX_INPUT_TOKENS = 1024
+# Overlapping windows for long reports: (window tokens, overlap tokens), shrunk
+# proportionally for models with a smaller budget (e.g. T5's 512)
+_CHUNK_TOKENS = 768
+_CHUNK_OVERLAP = 128
+# (max_length, min_length) of the intermediate per-chunk summaries
+_CHUNK_SUMMARY_LENGTHS = (120, 40)
+
+# Beam width of the HF summarization pipeline, used when the checkpoint sets none
+_DEFAULT_NUM_BEAMS = 4
+
+# Rows per generate call when batching many inputs: fixed on CPU; on GPU sized
+# from free memory (this fraction of it), capped at _MAX_BATCH_SIZE
+_CPU_BATCH_SIZE = 8
+_MAX_BATCH_SIZE = 32
+_GPU_MEMORY_FRACTION = 0.5
+
+# Summaries up to this many tokens (alerts, titles) decode greedily by default;
+# beam search multiplies decoder work for little gain on a handful of tokens
+_GREEDY_MAX_LENGTH = 25
+
+# Encoder length bucket for the CUDA-graph (static cache) decoder
+_GRAPH_PAD_MULTIPLE = 64
+
+# Generated level summaries kept per summarizer (LRU), keyed by report digest +
+# level settings; a reloaded model is a new summarizer with an empty cache
+_SUMMARY_CACHE_SIZE = 128
+
+# Exported + int8-quantized ONNX models, reused across runs
+_ONNX_CACHE_DIR = Path.home() / ".cache" / "disaster-summarizer" / "onnx"
+
 
 class AudienceRole(str, Enum):
     """
@@ -35,10 +108,145 @@ class AudienceRole(str, Enum):
     AUTHORITIES = "authorities"
 
 
+# Audience-specific summary levels produced by generate_all_summaries:
+# label -> (audience role, abstraction level, max_length, min_length, num_beams)
+# The 1-line alert decodes greedily; beams only pay off on longer outputs.
+SUMMARY_LEVELS = {
+    "alert": (AudienceRole.GENERAL_PUBLIC, "high", 20, 8, 1),
+    "short": (AudienceRole.EMERGENCY_RESPONDERS, "medium", 60, 25, 4),
+    "detailed": (AudienceRole.AUTHORITIES, "low", 150, 60, 4),
+}
+
+
+class _RowLengthLogitsProcessor(LogitsProcessor):
+    """
+    Per-row min/max summary lengths for one batched generate call
+    
+    `generate` only takes a single min_length/max_length for the whole
+    batch; this processor bans EOS until each row reaches its own minimum
+    and forces EOS once it hits its own maximum.
+    """
+    
+    def __init__(self, min_lengths: List[int], max_lengths: List[int], eos_token_id: int, num_beams: int = 1):
+        # Beams of one input are laid out contiguously in the expanded batch
+        self.min_lengths = torch.tensor(min_lengths).repeat_interleave(num_beams)
+        self.max_lengths = torch.tensor(max_lengths).repeat_interleave(num_beams)
+        self.eos_token_id = eos_token_id
+    
+    def __call__(self, input_ids: torch.LongTensor, scores: torch.FloatTensor) -> torch.FloatTensor:
+        cur_len = input_ids.shape[-1]
+        scores = scores.clone()
+        
+        too_short = (cur_len < self.min_lengths).to(scores.device)
+        scores[too_short, self.eos_token_id] = -float("inf")
+        
+        at_limit = (cur_len >= self.max_lengths - 1).to(scores.device)
+        if at_limit.any():
+            scores[at_limit] = -float("inf")
+            scores[at_limit, self.eos_token_id] = 0
+        return scores
+
+
+@functools.lru_cache(maxsize=None)
+def _has_cuda() -> bool:
+    """Whether a CUDA device is usable, probed once per process (driver init is slow)"""
+    return torch.cuda.is_available()
+
+
+@functools.lru_cache(maxsize=None)
+def _cuda_capability() -> Tuple[int, int]:
+    """Compute capability of GPU 0, queried once per process"""
+    return torch.cuda.get_device_capability(0)
+
+
+def _default_num_beams(max_length: int) -> Optional[int]:
+    """Greedy for very short summaries, the model's own beam width (None) otherwise"""
+    return 1 if max_length <= _GREEDY_MAX_LENGTH else None
+
+
+# (audience role, abstraction level) guidance of one model input
+_Guidance = Tuple[Optional[AudienceRole], Optional[str]]
+
+# Guidance sentence per audience role. AudienceRole is a str enum, so plain role
+# strings ("general_public", ...) look up the same entries
+_ROLE_GUIDANCE: Dict[str, str] = {
+    AudienceRole.GENERAL_PUBLIC: (
+        "AUDIENCE: GENERAL PUBLIC. "
+        "TASK: Write a simple, non-technical, easy-to-understand summary "
+        "that explains what happened and basic safety implications."
+    ),
+    AudienceRole.EMERGENCY_RESPONDERS: (
+        "AUDIENCE: EMERGENCY RESPONDERS. "
+        "TASK: Write an operational situation summary focusing on "
+        "affected areas, current conditions, access constraints, and "
+        "information useful for field coordination."
+    ),
+    AudienceRole.AUTHORITIES: (
+        "AUDIENCE: GOVERNMENT AUTHORITIES. "
+        "TASK: Write a strategic overview focusing on overall impact, "
+        "key figures, priorities, and coordination needs for decision-makers."
+    ),
+}
+
+# Guidance sentence per abstraction level
+_ABSTRACTION_GUIDANCE: Dict[str, str] = {
+    "high": (
+        "ABSTRACTION LEVEL: HIGH. Focus on only the most critical points, "
+        "avoid technical details, and keep the summary very short."
+    ),
+    "medium": (
+        "ABSTRACTION LEVEL: MEDIUM. Balance brevity with operationally "
+        "useful details while keeping the text readable."
+    ),
+    "low": (
+        "ABSTRACTION LEVEL: LOW. Include key figures, concrete impacts, "
+        "and nuanced context while remaining concise."
+    ),
+}
+
+
+def _guidance_text(
+    audience_role: Optional[AudienceRole] = None,
+    abstraction_level: Optional[Literal["high", "medium", "low"]] = None,
+) -> str:
+    """
+    Audience/abstraction guidance put in front of the report
+
+    Injects lightweight audience/abstraction control as a prefix. This
+    preserves the single underlying transformer model while making the
+    system explicitly audience-aware.
+
+    Args:
+        audience_role: Optional target audience
+        abstraction_level: Optional abstraction level
+
+    Returns:
+        Guidance prefix, ending before the report text ("" without guidance)
+    """
+    guidance_parts = [
+        part for part in (
+            _ROLE_GUIDANCE.get(audience_role) if audience_role else None,
+            _ABSTRACTION_GUIDANCE.get(abstraction_level) if abstraction_level else None,
+        )
+        if part
+    ]
+    if not guidance_parts:
+        # Backwards-compatible behaviour: generic summarization
+        return ""
+    return f"{' '.join(guidance_parts)}\n\nDisaster report:\n"
+
+
 class DisasterSummarizer:
     """Multi-level summarization for disaster reports using T5/BART"""
     
-    def __init__(self, model_name: str = "facebook/bart-large-cnn", use_t5: bool = False):
+    def __init__(
+        self,
+        model_name: str = "facebook/bart-large-cnn",
+        use_t5: bool = False,
+        precision: str = "auto",
+        compile_model: bool = False,
+        use_onnx: bool = False,
+    ):
         """
         Initialize summarization model
         
@@ -47,32 +255,246 @@ class DisasterSummarizer:
                        - "facebook/bart-large-cnn" (default, best for news/summaries)
                        - "t5-base" or "t5-large" for T5 models
             use_t5: If True, use T5 model instead of BART
+            precision: Weight precision on GPU ("auto", "fp16", "bf16", "fp32" or "int8").
+                       "auto" picks bf16 on compute capability 8.x+ and fp16 otherwise.
+                       CPU runs in FP32, except "int8" which selects the quantized
+                       ONNX Runtime backend (same as use_onnx), or PyTorch dynamic
+                       int8 quantization when ONNX Runtime is not installed.
+                       With "auto", the DISASTER_SUMM_QUANT environment variable
+                       (one of the values above) takes precedence when set.
+            compile_model: If True, compile the decoder forward with torch.compile
+                           (PyTorch 2.x), with a static KV cache on GPU. Adds a
+                           one-off compile cost on first use.
+            use_onnx: If True, run an ONNX Runtime export of the model instead of
+                      PyTorch (requires `pip install .[ort]`): int8-quantized on CPU,
+                      CUDA execution provider with I/O binding on GPU. The export
+                      is cached on disk.
         """
+        if precision == "auto":
+            precision = os.environ.get(_PRECISION_ENV) or precision
+        if precision not in _PRECISIONS:
+            raise ValueError(
+                f"Unsupported precision '{precision}'. Choose one of: {', '.join(_PRECISIONS)}"
+            )
+        
         if use_t5:
             model_name = "t5-base" if "t5" not in model_name.lower() else model_name
-            logger.info(f"[MODEL] Initializing T5 summarization model: {model_name}")
+            logger.info("[MODEL] Initializing T5 summarization model: %s", model_name)
         else:
-            logger.info(f"[MODEL] Initializing BART summarization model: {model_name}")
+            logger.info("[MODEL] Initializing BART summarization model: %s", model_name)
         
-        self.device = 0 if torch.cuda.is_available() else -1
+        self.device = 0 if _has_cuda() else -1
         device_name = 'CUDA (GPU)' if self.device == 0 else 'CPU'
-        logger.info(f"[MODEL] Computing device: {device_name}")
+        logger.info("[MODEL] Computing device: %s", device_name)
+        
+        if precision == "auto":
+            precision = "bf16" if self.device == 0 and _cuda_capability()[0] >= 8 else "fp16"
+        
+        load_in_8bit = precision == "int8" and self.device == 0
+        if load_in_8bit and not BNB_AVAILABLE:
+            logger.warning("[MODEL] bitsandbytes not installed, falling back to fp16. Install with: pip install .[int8]")
+            load_in_8bit = False
+        elif load_in_8bit and _cuda_capability() < (7, 5):
+            # int8 tensor-core matmuls need Turing or newer
+            logger.warning("[MODEL] GPU has no int8 tensor cores, falling back to fp16")
+            load_in_8bit = False
+        if precision == "int8" and self.device == -1:
+            use_onnx = True
+        
+        # Half precision halves weight bandwidth and runs matmuls on tensor cores
+        self.torch_dtype = _GPU_DTYPES.get(precision, torch.float16) if self.device == 0 else torch.float32
+        logger.info("[MODEL] Weight precision: %s", "int8" if load_in_8bit else self.torch_dtype)
         
         try:
-            logger.info(f"[MODEL] Downloading/loading model and tokenizer... (this may take a minute on first run)")
-            # Initialize summarization pipeline
-            self.summarizer = pipeline(
-                "summarization",
-                model=model_name,
-                tokenizer=model_name,
-                device=self.device
-            )
+            logger.info("[MODEL] Downloading/loading model and tokenizer... (this may take a minute on first run)")
+            # Rust-backed tokenizer; the Python BPE fallback is far slower
+            tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+            if not tokenizer.is_fast:
+                logger.warning("[MODEL] No fast tokenizer available for '%s', using the slow Python tokenizer", model_name)
+            
+            if use_onnx and not ORT_AVAILABLE:
+                logger.warning("[MODEL] optimum[onnxruntime] not installed, falling back to PyTorch. "
+                               "Install with: pip install .[ort]")
+            use_onnx = use_onnx and ORT_AVAILABLE
+            
+            model_kwargs = {}
+            if load_in_8bit and not use_onnx:
+                # Quantized weights are placed by accelerate and must not be moved afterwards
+                model_kwargs.update(
+                    quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+                    device_map="auto",
+                )
+            
+            # Fused FlashAttention-2 kernels (Ampere+, half precision) never materialize the
+            # attention matrix; T5's relative position bias is not supported by them
+            if (
+                not use_onnx and not use_t5 and self.device == 0
+                and self.torch_dtype in (torch.float16, torch.bfloat16)
+                and _cuda_capability()[0] >= 8
+                and is_flash_attn_2_available()
+            ):
+                model_kwargs["attn_implementation"] = "flash_attention_2"
+                logger.info("[MODEL] Using FlashAttention-2")
+            elif not use_onnx and not use_t5:
+                # Otherwise PyTorch's fused scaled_dot_product_attention, which dispatches to
+                # its flash / memory-efficient kernels (the math path only as fallback, e.g.
+                # for padded batches on older GPUs); T5 has no SDPA implementation
+                model_kwargs["attn_implementation"] = "sdpa"
+                logger.info("[MODEL] Using PyTorch SDPA attention")
+            
+            # Model and tokenizer are driven directly through model.generate; no
+            # summarization pipeline (and its per-call pre/post-processing) is built
+            if use_onnx:
+                self.model = self._load_onnx_model(model_name, use_cuda=self.device == 0)
+            else:
+                self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                    model_name, torch_dtype=self.torch_dtype, **model_kwargs
+                )
+                if not load_in_8bit:
+                    self.model.to("cuda" if self.device == 0 else "cpu")
             self.model_name = model_name
-            logger.info(f"[MODEL] ✓ Model '{model_name}' loaded successfully on {device_name}")
+            self.tokenizer = tokenizer
+            
+            # Summarization defaults the HF pipeline used to apply: the checkpoint's task
+            # parameters (T5's "summarize: " prefix and beam settings), on a private copy
+            # of the generation config so the model's own stays untouched
+            self.generation_config = copy.deepcopy(self.model.generation_config)
+            task_params = dict((self.model.config.task_specific_params or {}).get("summarization", {}))
+            self.prefix = task_params.pop("prefix", None) or getattr(self.model.config, "prefix", None) or ""
+            self.generation_config.update(**task_params)
+            if self.generation_config.num_beams == 1:
+                self.generation_config.num_beams = _DEFAULT_NUM_BEAMS
+            if self.generation_config.pad_token_id is None:
+                self.generation_config.pad_token_id = self.tokenizer.pad_token_id
+            
+            # Encoder token budget: the tokenizer's limit, capped by the learned position
+            # table (BART: 1024); T5 has relative positions and a 512-token tokenizer limit
+            max_input_tokens = self.tokenizer.model_max_length
+            max_positions = getattr(self.model.config, "max_position_embeddings", None)
+            if max_positions:
+                max_input_tokens = min(max_input_tokens, max_positions)
+            elif max_input_tokens > 1_000_000:
+                # Tokenizer saved without a limit (model_max_length left at its sentinel)
+                max_input_tokens = _MAX_INPUT_TOKENS
+            self._max_input_tokens = max_input_tokens
+            
+            # Token ids of the model prefix + guidance for every audience/abstraction
+            # combination, tokenized once and spliced in front of each report
+            self._prefix_ids: Dict[_Guidance, List[int]] = {}
+            for audience_role in (None, *_ROLE_GUIDANCE):
+                for abstraction_level in (None, *_ABSTRACTION_GUIDANCE):
+                    self._prefix_token_ids((audience_role, abstraction_level))
+            # Report tokens that fit next to the longest prefix and the EOS token
+            self._max_report_tokens = self._max_input_tokens - max(map(len, self._prefix_ids.values())) - 1
+            
+            if precision == "int8" and self.device == -1 and not use_onnx:
+                # No ONNX Runtime: quantize the Linear layers to int8 in PyTorch instead
+                # (weights 4x smaller, VNNI/oneDNN int8 GEMMs; activations quantized on the fly)
+                torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+                )
+                logger.info("[MODEL] ✓ Linear layers dynamically quantized to int8 (PyTorch)")
+            
+            self._summary_cache = OrderedDict()
+            self._summary_cache_lock = threading.Lock()
+            
+            # Encoder inputs are padded to a multiple of this when set (see _compile_decoder)
+            self._pad_to_multiple_of = None
+            if compile_model and not use_onnx:
+                self._compile_decoder()
+            logger.info("[MODEL] ✓ Model '%s' loaded successfully on %s", model_name, device_name)
         except Exception as e:
-            logger.error(f"[ERROR] Failed to load model '{model_name}': {str(e)}")
+            logger.error("[ERROR] Failed to load model '%s': %s", model_name, e)
             raise
     
+    @staticmethod
+    def _load_onnx_model(model_name: str, use_cuda: bool = False) -> "ORTModelForSeq2SeqLM":
+        """
+        Load an ONNX Runtime export of the model
+        
+        The first call exports the checkpoint to ONNX; later calls load
+        straight from disk. ORT applies its graph fusions (attention,
+        LayerNorm, GELU) when the sessions are created, and the ORT model
+        keeps the HF `generate` API.
+        
+        - CPU: every graph (encoder and decoders) is additionally
+          dynamically quantized to int8, once. Int8 GEMMs (VNNI/oneDNN on
+          modern x86) are markedly faster than FP32 PyTorch on CPU.
+        - GPU: the FP32 export runs on the CUDA execution provider with
+          I/O binding, so inputs, outputs and the KV cache stay on the device
+          between decoding steps.
+        
+        Args:
+            model_name: HuggingFace model name or local path
+            use_cuda: Load on the CUDA execution provider instead of the CPU one
+            
+        Returns:
+            ORTModelForSeq2SeqLM
+        """
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        cache_dir = _ONNX_CACHE_DIR / model_name.replace("/", "--")
+        export_dir = cache_dir / "export"
+        quantized_dir = cache_dir / "int8"
+        
+        if not export_dir.exists():
+            logger.info("[MODEL] Exporting '%s' to ONNX (one-off)...", model_name)
+            ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True).save_pretrained(export_dir)
+        
+        if use_cuda:
+            logger.info("[MODEL] Loading ONNX model from %s (CUDA execution provider)", export_dir)
+            return ORTModelForSeq2SeqLM.from_pretrained(
+                export_dir, provider="CUDAExecutionProvider", use_io_binding=True
+            )
+        
+        if not quantized_dir.exists():
+            logger.info("[MODEL] Quantizing ONNX export of '%s' to int8 (one-off)...", model_name)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            for onnx_file in sorted(export_dir.glob("*.onnx")):
+                quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=onnx_file.name)
+                quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+        
+        # The quantizer writes <graph>_quantized.onnx next to the copied config
+        file_names = {
+            f"{graph}_file_name": f"{graph}_model_quantized.onnx"
+            for graph in ("encoder", "decoder", "decoder_with_past")
+            if (quantized_dir / f"{graph}_model_quantized.onnx").exists()
+        }
+        logger.info("[MODEL] Loading int8 ONNX model from %s", quantized_dir)
+        return ORTModelForSeq2SeqLM.from_pretrained(
+            quantized_dir, provider="CPUExecutionProvider", **file_names
+        )
+    
+    def _compile_decoder(self) -> None:
+        """
+        Compile the decoder forward, which runs once per generated token
+        
+        The encoder runs once per call on variable-length input, so it stays
+        eager. On GPU the decoder switches to a static (preallocated) KV cache,
+        so its per-step shapes stay fixed and it can be captured into CUDA
+        graphs ("reduce-overhead"), removing per-token launch overhead. On CPU
+        it is compiled with dynamic shapes to avoid a recompile every time
+        the sequence grows.
+        """
+        if not hasattr(torch, "compile"):
+            logger.warning("[MODEL] torch.compile requires PyTorch 2.x, running the decoder eagerly")
+            return
+        
+        decoder = self.model.get_decoder()
+        if self.device == 0:
+            # _generate passes the summarizer's generation config, which is a copy of the model's
+            for generation_config in (self.model.generation_config, self.generation_config):
+                generation_config.cache_implementation = "static"
+            decoder.forward = torch.compile(decoder.forward, mode="reduce-overhead")
+            # Cross-attention shapes follow the encoder length; bucketing it lets each
+            # captured graph be replayed across reports instead of re-captured per length
+            self._pad_to_multiple_of = _GRAPH_PAD_MULTIPLE
+            logger.info("[MODEL] ✓ Decoder compiled with torch.compile + static KV cache (compilation happens on first generate)")
+        else:
+            decoder.forward = torch.compile(decoder.forward, dynamic=True)
+            logger.info("[MODEL] ✓ Decoder compiled with torch.compile (compilation happens on first generate)")
+    
     def generate_summary(
         self,
         text: str,
@@ -81,6 +503,7 @@ class DisasterSummarizer:
         do_sample: bool = False,
         audience_role: Optional[AudienceRole] = None,
         abstraction_level: Optional[Literal["high", "medium", "low"]] = None,
+        num_beams: Optional[int] = None,
     ) -> str:
         """
         Generate a single summary
@@ -98,6 +521,8 @@ class DisasterSummarizer:
                                - "high": very short, coarse, non-technical
                                - "medium": balanced operational detail
                                - "low": detailed, analytical/administrative
+            num_beams: Beam width. Default: greedy for summaries of at most
+                       25 tokens, the model's beam search otherwise
             
         Returns:
             Summarized text
@@ -105,159 +530,584 @@ class DisasterSummarizer:
         if not text or len(text.strip()) == 0:
             return "No text provided for summarization."
         
-        # Truncate input if too long (most models have token limits)
-        # BART/T5 typically handle up to 1024 tokens
-        max_input_length = 1024
+        try:
+            summary = self._generate(
+                [text], [max_length], [min_length], do_sample=do_sample,
+                num_beams=_default_num_beams(max_length) if num_beams is None else num_beams,
+                guidance=[(audience_role, abstraction_level)],
+            )[0]
+            logger.debug(
+                "[SUMMARIZATION] Generated summary: %d characters (target: %d-%d tokens)",
+                len(summary), min_length, max_length
+            )
+            return summary
+            
+        except Exception as e:
+            logger.error("[ERROR] Summarization failed: %s", e)
+            return f"Error generating summary: {str(e)}"
+    
+    def generate_summary_batch(
+        self,
+        texts: List[str],
+        max_length: Union[int, Sequence[int]] = 100,
+        min_length: Union[int, Sequence[int]] = 30,
+        do_sample: bool = False,
+        num_beams: Optional[Union[int, Sequence[Optional[int]]]] = None,
+        audience_role: Optional[Union[AudienceRole, Sequence[Optional[AudienceRole]]]] = None,
+        abstraction_level: Optional[Union[str, Sequence[Optional[str]]]] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Generate summaries for several inputs in batched generate calls
+        
+        Inputs sharing a beam width are decoded together, so short greedy
+        rows (e.g. a title) add at most one extra generate call. Large
+        groups are split into batches of `batch_size` rows of similar length.
+        
+        Args:
+            texts: Input texts to summarize
+            max_length: Maximum summary length, shared or one per input
+            min_length: Minimum summary length, shared or one per input
+            do_sample: Whether to use sampling (False for deterministic)
+            num_beams: Beam width, shared or one per input. None picks the
+                       length-based default of generate_summary
+            audience_role: Optional target audience, shared or one per input
+            abstraction_level: Optional abstraction level, shared or one per input
+            batch_size: Rows per generate call. Default: sized from free GPU
+                        memory (see _auto_batch_size)
+            
+        Returns:
+            Summaries, in input order
+        """
+        def per_input(value, scalar_types):
+            return [value] * len(texts) if value is None or isinstance(value, scalar_types) else list(value)
+        
+        max_lengths = per_input(max_length, int)
+        min_lengths = per_input(min_length, int)
+        beams = [
+            _default_num_beams(length) if width is None else width
+            for width, length in zip(per_input(num_beams, int), max_lengths)
+        ]
+        guidance = list(zip(per_input(audience_role, str), per_input(abstraction_level, str)))
+        
+        summaries = ["No text provided for summarization."] * len(texts)
+        batches = {}
+        for index, text in enumerate(texts):
+            if text and text.strip():
+                batches.setdefault(beams[index], []).append(index)
         
         try:
-            # For very long texts, we might need to chunk, but for now we'll truncate.
-            # In production, you'd want smarter chunking by sentence/paragraph.
-            base_text = text[: max_input_length * 4]  # Rough character estimate
-            if len(text) > len(base_text):
-                logger.warning(
-                    f"[SUMMARIZATION] Input text truncated from {len(text)} to {len(base_text)} characters"
-                )
-
-            # Inject lightweight audience/abstraction control as a prefix.
-            # This preserves the single underlying transformer model
-            # while making the system explicitly audience-aware.
-            if audience_role or abstraction_level:
-                guidance_parts = []
-
-                if audience_role:
-                    if audience_role == AudienceRole.GENERAL_PUBLIC:
-                        guidance_parts.append(
-                            "AUDIENCE: GENERAL PUBLIC. "
-                            "TASK: Write a simple, non-technical, easy-to-understand summary "
-                            "that explains what happened and basic safety implications."
-                        )
-                    elif audience_role == AudienceRole.EMERGENCY_RESPONDERS:
-                        guidance_parts.append(
-                            "AUDIENCE: EMERGENCY RESPONDERS. "
-                            "TASK: Write an operational situation summary focusing on "
-                            "affected areas, current conditions, access constraints, and "
-                            "information useful for field coordination."
-                        )
-                    elif audience_role == AudienceRole.AUTHORITIES:
-                        guidance_parts.append(
-                            "AUDIENCE: GOVERNMENT AUTHORITIES. "
-                            "TASK: Write a strategic overview focusing on overall impact, "
-                            "key figures, priorities, and coordination needs for decision-makers."
-                        )
-
-                if abstraction_level:
-                    if abstraction_level == "high":
-                        guidance_parts.append(
-                            "ABSTRACTION LEVEL: HIGH. Focus on only the most critical points, "
-                            "avoid technical details, and keep the summary very short."
-                        )
-                    elif abstraction_level == "medium":
-                        guidance_parts.append(
-                            "ABSTRACTION LEVEL: MEDIUM. Balance brevity with operationally "
-                            "useful details while keeping the text readable."
-                        )
-                    elif abstraction_level == "low":
-                        guidance_parts.append(
-                            "ABSTRACTION LEVEL: LOW. Include key figures, concrete impacts, "
-                            "and nuanced context while remaining concise."
-                        )
-
-                guidance_prefix = " ".join(guidance_parts).strip()
-                if guidance_prefix:
-                    input_text = f"{guidance_prefix}\n\nDisaster report:\n{base_text}"
-                else:
-                    input_text = base_text
-            else:
-                # Backwards-compatible behaviour: generic summarization
-                input_text = base_text
+            for width, rows in batches.items():
+                size = batch_size or self._auto_batch_size(width or 1)
+                if len(rows) > size:
+                    # Length-sorted rows put similar lengths in the same batch, so
+                    # little compute goes to padding up to each batch's longest row
+                    rows = sorted(rows, key=lambda index: len(texts[index]) + len(_guidance_text(*guidance[index])))
+                for start in range(0, len(rows), size):
+                    batch = rows[start:start + size]
+                    outputs = self._generate(
+                        [texts[index] for index in batch],
+                        max_lengths=[max_lengths[index] for index in batch],
+                        min_lengths=[min_lengths[index] for index in batch],
+                        do_sample=do_sample,
+                        num_beams=width,
+                        guidance=[guidance[index] for index in batch],
+                    )
+                    for index, summary in zip(batch, outputs):
+                        summaries[index] = summary
+        except Exception as e:
+            logger.error("[ERROR] Batched summarization failed: %s", e)
+            return [f"Error generating summary: {str(e)}"] * len(texts)
+        return summaries
+    
+    def _auto_batch_size(self, num_beams: int) -> int:
+        """
+        Rows per generate call that fit the device
+        
+        On GPU, a row's footprint is bounded by its cross- and self-attention
+        KV cache at full input length (2 tensors x 2 attentions per decoder
+        layer, per beam); the batch uses a fraction of the currently free
+        memory. CPU batches stay small, where larger ones only add padding.
+        
+        Args:
+            num_beams: Beam width of the batch
+            
+        Returns:
+            Batch size between 1 and _MAX_BATCH_SIZE
+        """
+        if self.model.device.type != "cuda":
+            return _CPU_BATCH_SIZE
+        config = self.model.config
+        layers = getattr(config, "decoder_layers", None) or getattr(config, "num_decoder_layers", None) or 12
+        hidden = getattr(config, "d_model", None) or 1024
+        element_size = torch.finfo(self.torch_dtype).bits // 8
+        row_bytes = num_beams * 4 * layers * hidden * self._max_input_tokens * element_size
+        free_bytes, _total = torch.cuda.mem_get_info(self.model.device)
+        return max(1, min(_MAX_BATCH_SIZE, int(free_bytes * _GPU_MEMORY_FRACTION) // row_bytes))
+    
+    def chunk_and_summarize(self, text: str) -> str:
+        """
+        Condense a report longer than the model's input budget
+        
+        Instead of cutting the tail off at the model's token budget (1024
+        for BART, less the guidance prefix), the report is split into
+        overlapping 768-token windows (128-token overlap, both scaled down
+        for smaller budgets) which are summarized in one batched generate
+        call; the concatenated chunk summaries then stand in for the report.
+        Each window costs O(W^2) attention instead of one O(L^2) pass.
+        Reports within the budget are returned unchanged, without any extra
+        model call.
+        
+        Args:
+            text: Raw input text
+            
+        Returns:
+            The text itself, or the concatenation of its chunk summaries
+        """
+        # Every token spans at least one character, so short texts need no tokenizing
+        if len(text) <= self._max_report_tokens:
+            return text
+        
+        # verbose=False: a sequence over model_max_length is expected here
+        token_ids = self.tokenizer(text, add_special_tokens=False, verbose=False)["input_ids"]
+        if len(token_ids) <= self._max_report_tokens:
+            return text
+        
+        window = min(_CHUNK_TOKENS, self._max_input_tokens * _CHUNK_TOKENS // _MAX_INPUT_TOKENS)
+        overlap = window * _CHUNK_OVERLAP // _CHUNK_TOKENS
+        chunks = [
+            self.tokenizer.decode(token_ids[start:start + window], skip_special_tokens=True)
+            for start in range(0, len(token_ids) - overlap, window - overlap)
+        ]
+        logger.info(
+            "[SUMMARIZATION] Long input (%d tokens): summarizing %d overlapping chunks",
+            len(token_ids), len(chunks)
+        )
+        
+        max_length, min_length = _CHUNK_SUMMARY_LENGTHS
+        chunk_summaries = self._generate(
+            chunks, max_lengths=[max_length] * len(chunks), min_lengths=[min_length] * len(chunks)
+        )
+        return " ".join(chunk_summaries)
+    
+    def _prefix_token_ids(self, guidance: _Guidance) -> List[int]:
+        """
+        Token ids placed before a report: leading special tokens, the model's
+        task prefix (e.g. T5's "summarize: ") and the audience guidance
+        
+        Args:
+            guidance: (audience role, abstraction level) of the input
             
-            result = self.summarizer(
-                input_text,
-                max_length=max_length,
-                min_length=min_length,
+        Returns:
+            Prefix token ids (cached per guidance)
+        """
+        prefix_ids = self._prefix_ids.get(guidance)
+        if prefix_ids is None:
+            prefix = self.prefix + _guidance_text(*guidance)
+            # Drop the trailing EOS; it is appended after the report
+            prefix_ids = self.tokenizer(prefix)["input_ids"][:-1]
+            self._prefix_ids[guidance] = prefix_ids
+        return prefix_ids
+    
+    def _generate(
+        self,
+        input_texts: List[str],
+        max_lengths: List[int],
+        min_lengths: List[int],
+        do_sample: bool = False,
+        num_beams: Optional[int] = None,
+        streamer: Optional[TextIteratorStreamer] = None,
+        guidance: Optional[Sequence[_Guidance]] = None,
+    ) -> List[str]:
+        """
+        Run one batched generate call over several model inputs
+        
+        Each row keeps its own length limits, so inputs with different
+        targets (e.g. alert vs. detailed summary) share a single encoder
+        forward and decoder loop.
+        
+        Args:
+            input_texts: Report texts (without prefix or guidance)
+            max_lengths: Maximum summary length (tokens) per input
+            min_lengths: Minimum summary length (tokens) per input
+            do_sample: Whether to use sampling (False for deterministic)
+            num_beams: Beam width; None keeps the model's default (4 for BART-CNN)
+            streamer: Optional streamer receiving tokens as they are generated
+                      (single input, greedy decoding only)
+            guidance: Optional (audience role, abstraction level) per input
+            
+        Returns:
+            Decoded summaries, in input order
+        """
+        generation_config = self.generation_config
+        if num_beams is None:
+            num_beams = generation_config.num_beams or 1
+        
+        if num_beams > 1:
+            # Stop the beam search as soon as every beam has finished
+            search_kwargs = {"num_beams": num_beams, "early_stopping": True}
+        else:
+            # Plain greedy decoding; neutralise beam-only defaults from the model config
+            search_kwargs = {"num_beams": 1, "early_stopping": False, "length_penalty": 1.0}
+        if not do_sample:
+            # Deterministic decoding: clear any sampling settings inherited from the
+            # model config so no temperature/top-k/top-p warpers are configured
+            search_kwargs.update(temperature=None, top_k=None, top_p=None)
+        
+        # Only the reports are tokenized (one batched pass); the precomputed prefix ids
+        # are spliced in front and over-long rows are cut at the model's token limit
+        if guidance is None:
+            guidance = [(None, None)] * len(input_texts)
+        text_ids = self.tokenizer(list(input_texts), add_special_tokens=False, verbose=False)["input_ids"]
+        max_tokens = self._max_input_tokens
+        rows = []
+        truncated = 0
+        for ids, row_guidance in zip(text_ids, guidance):
+            prefix_ids = self._prefix_token_ids(row_guidance)
+            if len(prefix_ids) + len(ids) + 1 > max_tokens:
+                truncated += 1
+            rows.append(prefix_ids + ids[:max_tokens - len(prefix_ids) - 1] + [self.tokenizer.eos_token_id])
+        
+        width = max(len(row) for row in rows)
+        if self._pad_to_multiple_of is not None:
+            # Lengths are bucketed for the compiled decoder's captured graphs
+            width = -(-width // self._pad_to_multiple_of) * self._pad_to_multiple_of
+        input_ids = torch.full((len(rows), width), self.tokenizer.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(rows), width), dtype=torch.long)
+        for index, row in enumerate(rows):
+            input_ids[index, :len(row)] = torch.tensor(row)
+            attention_mask[index, :len(row)] = 1
+        inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        
+        if self.model.device.type == "cuda":
+            # Page-locked staging (recycled by torch's caching host allocator) lets the
+            # host-to-device copy run asynchronously instead of through a pageable bounce buffer
+            inputs = {
+                name: tensor.pin_memory().to(self.model.device, non_blocking=True)
+                for name, tensor in inputs.items()
+            }
+        else:
+            inputs = {name: tensor.to(self.model.device) for name, tensor in inputs.items()}
+        if truncated:
+            logger.warning("[SUMMARIZATION] Input truncated to %d tokens (%d of %d rows)", max_tokens, truncated, len(rows))
+        
+        length_processor = _RowLengthLogitsProcessor(
+            min_lengths, max_lengths, self.tokenizer.eos_token_id, num_beams=num_beams
+        )
+        # inference_mode also skips the version-counter and view tracking that
+        # generate's own no_grad still pays for on every decoding step
+        with torch.inference_mode():
+            output_ids = self.model.generate(
+                **inputs,
+                generation_config=generation_config,
+                max_length=max(max_lengths),
+                min_length=min(min_lengths),
                 do_sample=do_sample,
-                truncation=True
+                use_cache=True,
+                no_repeat_ngram_size=3,
+                logits_processor=LogitsProcessorList([length_processor]),
+                streamer=streamer,
+                **search_kwargs,
             )
+        
+        summaries = self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+        return [summary.strip() for summary in summaries]
+    
+    def _stream_generate(
+        self,
+        input_text: str,
+        max_length: int,
+        min_length: int,
+        guidance: _Guidance = (None, None),
+    ) -> Iterator[str]:
+        """
+        Greedily generate one summary, yielding text chunks as they are decoded
+        
+        Args:
+            input_text: Report text
+            max_length: Maximum summary length (tokens)
+            min_length: Minimum summary length (tokens)
+            guidance: (audience role, abstraction level) of the summary
+            
+        Yields:
+            Newly decoded text chunks
+        """
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        errors = []
+        
+        def run():
+            try:
+                self._generate(
+                    [input_text], [max_length], [min_length],
+                    num_beams=1, streamer=streamer, guidance=[guidance]
+                )
+            except Exception as e:
+                # Unblock the consumer; the error is re-raised below
+                errors.append(e)
+                streamer.end()
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        for chunk in streamer:
+            yield chunk
+        thread.join()
+        if errors:
+            raise errors[0]
+    
+    def stream_summary(
+        self,
+        text: str,
+        max_length: int = 100,
+        min_length: int = 30,
+        audience_role: Optional[AudienceRole] = None,
+        abstraction_level: Optional[Literal["high", "medium", "low"]] = None,
+    ) -> Iterator[str]:
+        """
+        Streaming variant of generate_summary (greedy decoding)
+        
+        Args:
+            text: Input text to summarize
+            max_length: Maximum length of summary
+            min_length: Minimum length of summary
+            audience_role: Optional target audience (see generate_summary)
+            abstraction_level: Optional abstraction level (see generate_summary)
+            
+        Yields:
+            Summary text chunks as they are generated
+        """
+        if not text or len(text.strip()) == 0:
+            yield "No text provided for summarization."
+            return
+        
+        yield from self._stream_generate(text, max_length, min_length, (audience_role, abstraction_level))
+    
+    def warmup(self) -> None:
+        """
+        Run a tiny throwaway generation so CUDA context, kernel selection and
+        allocator pools are set up before the first real request
+        """
+        logger.info("[MODEL] Warming up model with a short dummy generation...")
+        warmup_text = "Warmup: a flood was reported in the city."
+        # Exercise both the greedy and the beam search decoding paths
+        for num_beams in sorted({spec[-1] for spec in SUMMARY_LEVELS.values()}):
+            self._generate([warmup_text], max_lengths=[8], min_lengths=[1], num_beams=num_beams)
+        logger.info("[MODEL] ✓ Model warm-up completed")
+    
+    def generate_level_summaries(
+        self,
+        text: str,
+        levels: Sequence[str] = ("alert", "short", "detailed"),
+        on_update: Optional[Callable[[str, str], None]] = None,
+    ) -> List[str]:
+        """
+        Generate the requested audience summary levels in one batched pass
+        
+        Callers that only need some levels (e.g. the structured report,
+        which replaces the detailed summary) skip the others entirely
+        instead of generating and discarding them. Results are cached per
+        report text, so repeated requests for the same report are free.
+        
+        Args:
+            text: Input disaster report text
+            levels: Keys of SUMMARY_LEVELS to generate ("alert", "short", "detailed")
+            on_update: Optional callback `on_update(level, text)` for progressive
+                       display. A greedy level decoded on its own (the alert) is
+                       streamed token by token; the others are reported once done.
+            
+        Returns:
+            List of summaries, in the order of `levels`
+        """
+        if not text or len(text.strip()) == 0:
+            return ["No text provided for summarization."] * len(levels)
+        
+        specs = [SUMMARY_LEVELS[level] for level in levels]
+        
+        # Decoding is deterministic, so identical text + level settings give identical summaries
+        cache_key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), tuple(specs))
+        with self._summary_cache_lock:
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                self._summary_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("[SUMMARIZATION] ✓ Summaries reused from cache")
+            if on_update is not None:
+                for level, summary in zip(levels, cached):
+                    on_update(level, summary)
+            return list(cached)
+        
+        summaries = [""] * len(levels)
+        try:
+            base_text = self.chunk_and_summarize(text)
             
-            summary = result[0]["summary_text"]
-            summary_length = len(summary.strip())
-            logger.debug(f"[SUMMARIZATION] Generated summary: {summary_length} characters (target: {min_length}-{max_length} tokens)")
-            return summary.strip()
+            # Levels sharing a beam width are decoded together in one batch
+            batches = {}
+            for index, (audience_role, abstraction_level, max_length, min_length, num_beams) in enumerate(specs):
+                batches.setdefault(num_beams, []).append(
+                    (index, (audience_role, abstraction_level), max_length, min_length)
+                )
             
+            for num_beams, rows in batches.items():
+                if on_update is not None and num_beams == 1 and len(rows) == 1:
+                    index, guidance, max_length, min_length = rows[0]
+                    partial = ""
+                    for chunk in self._stream_generate(base_text, max_length, min_length, guidance):
+                        partial += chunk
+                        on_update(levels[index], partial)
+                    summaries[index] = partial.strip()
+                    continue
+                
+                outputs = self._generate(
+                    [base_text] * len(rows),
+                    max_lengths=[max_length for _, _, max_length, _ in rows],
+                    min_lengths=[min_length for _, _, _, min_length in rows],
+                    num_beams=num_beams,
+                    guidance=[guidance for _, guidance, _, _ in rows],
+                )
+                for (index, _, _, _), summary in zip(rows, outputs):
+                    summaries[index] = summary
+                    if on_update is not None:
+                        on_update(levels[index], summary)
         except Exception as e:
-            logger.error(f"[ERROR] Summarization failed: {str(e)}")
-            return f"Error generating summary: {str(e)}"
+            # Failed generations are not cached, so the next request retries them
+            logger.error("[ERROR] Summarization failed: %s", e)
+            return [f"Error generating summary: {str(e)}"] * len(levels)
+        
+        with self._summary_cache_lock:
+            self._summary_cache[cache_key] = tuple(summaries)
+            if len(self._summary_cache) > _SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return summaries
     
-    def generate_all_summaries(self, text: str) -> Tuple[str, str, str]:
+    def generate_all_summaries(
+        self,
+        text: str,
+        on_update: Optional[Callable[[str, str], None]] = None,
+    ) -> Tuple[str, str, str]:
         """
         Generate three levels of summaries:
         1. General-public alert summary (high abstraction)
         2. Emergency responder operational summary (medium abstraction)
         3. Authority / administrative strategic summary (low abstraction)
         
+        Levels sharing a beam width are decoded together in one batched call.
+        
         Args:
             text: Input disaster report text
+            on_update: Optional progress callback `on_update(level, text)`,
+                       see generate_level_summaries
             
         Returns:
             Tuple of (alert, short_summary, detailed_summary)
         """
-        text_length = len(text)
-        logger.info(
-            f"[SUMMARIZATION] Starting audience-adaptive multi-level summary generation "
-            f"(input text: {text_length} characters)"
-        )
+        if not text or len(text.strip()) == 0:
+            return ("No text provided for summarization.",) * len(SUMMARY_LEVELS)
         
-        # 1. General public – very short, high-abstraction alert
         logger.info(
-            "[SUMMARIZATION] Step 1/3: Generating GENERAL PUBLIC alert summary "
-            "(1-line, high-abstraction, non-technical)..."
-        )
-        alert = self.generate_summary(
-            text,
-            max_length=20,
-            min_length=8,
-            audience_role=AudienceRole.GENERAL_PUBLIC,
-            abstraction_level="high",
+            "[SUMMARIZATION] Starting audience-adaptive multi-level summary generation "
+            "(input text: %d characters)", len(text)
         )
-        logger.info(f"[SUMMARIZATION] ✓ Alert generated ({len(alert)} characters)")
-        
-        # 2. Emergency responders – operational, medium abstraction
         logger.info(
-            "[SUMMARIZATION] Step 2/3: Generating EMERGENCY RESPONDER operational summary "
-            "(medium-length, situation + operations focus)..."
-        )
-        short = self.generate_summary(
-            text,
-            max_length=60,
-            min_length=25,
-            audience_role=AudienceRole.EMERGENCY_RESPONDERS,
-            abstraction_level="medium",
+            "[SUMMARIZATION] Generating GENERAL PUBLIC alert, EMERGENCY RESPONDER operational "
+            "and AUTHORITY strategic summaries in one batched pass..."
         )
-        logger.info(f"[SUMMARIZATION] ✓ Short summary generated ({len(short)} characters)")
         
-        # 3. Authorities – detailed, low abstraction strategic overview
-        logger.info(
-            "[SUMMARIZATION] Step 3/3: Generating AUTHORITY strategic summary "
-            "(longer, low-abstraction, impact + coordination focus)..."
-        )
-        detailed = self.generate_summary(
-            text,
-            max_length=150,
-            min_length=60,
-            audience_role=AudienceRole.AUTHORITIES,
-            abstraction_level="low",
-        )
-        logger.info(f"[SUMMARIZATION] ✓ Detailed summary generated ({len(detailed)} characters)")
+        alert, short, detailed = self.generate_level_summaries(text, on_update=on_update)
+        
+        logger.info("[SUMMARIZATION] ✓ Alert generated (%d characters)", len(alert))
+        logger.info("[SUMMARIZATION] ✓ Short summary generated (%d characters)", len(short))
+        logger.info("[SUMMARIZATION] ✓ Detailed summary generated (%d characters)", len(detailed))
         
         logger.info("[SUMMARIZATION] ✓ All three summary levels generated successfully")
         return alert, short, detailed
+    
+    def generate_all_summaries_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Generate the three summary levels for several reports at once
+        
+        Every (report, level) pair becomes one row; rows sharing a beam width
+        are decoded together, so N reports cost about as many generate calls
+        as one report instead of N times as many.
+        
+        Args:
+            texts: Input disaster report texts
+            batch_size: Rows per generate call (see generate_summary_batch)
+            
+        Returns:
+            List of (alert, short_summary, detailed_summary), in input order
+        """
+        logger.info("[SUMMARIZATION] Generating all summary levels for %d reports in batches", len(texts))
+        
+        specs = list(SUMMARY_LEVELS.values())
+        row_texts = []
+        for text in texts:
+            base_text = self.chunk_and_summarize(text) if text and text.strip() else ""
+            row_texts.extend([base_text] * len(specs))
+        
+        summaries = self.generate_summary_batch(
+            row_texts,
+            max_length=[spec[2] for spec in specs] * len(texts),
+            min_length=[spec[3] for spec in specs] * len(texts),
+            num_beams=[spec[4] for spec in specs] * len(texts),
+            audience_role=[spec[0] for spec in specs] * len(texts),
+            abstraction_level=[spec[1] for spec in specs] * len(texts),
+            batch_size=batch_size,
+        )
+        return [
+            tuple(summaries[start:start + len(specs)])
+            for start in range(0, len(summaries), len(specs))
+        ]
+
+
+# Loaded summarizers, shared by every caller in the process
+_SUMMARIZER_CACHE: Dict[Tuple[str, bool, bool, str, bool], DisasterSummarizer] = {}
+_SUMMARIZER_CACHE_LOCK = threading.Lock()
+
+
+def get_summarizer(
+    model_name: str = "facebook/bart-large-cnn",
+    use_t5: bool = False,
+    use_onnx: bool = False,
+    precision: str = "auto",
+    compile_model: bool = False
+) -> DisasterSummarizer:
+    """
+    Return the process-wide DisasterSummarizer for a model, loading it on first use
+    
+    Args:
+        model_name: Model to use
+        use_t5: Whether to use T5 instead of BART
+        use_onnx: Whether to run the ONNX Runtime export (see DisasterSummarizer)
+        precision: Weight precision (see DisasterSummarizer)
+        compile_model: Whether to torch.compile the decoder (see DisasterSummarizer)
+        
+    Returns:
+        Cached DisasterSummarizer instance
+    """
+    key = (model_name, use_t5, use_onnx, precision, compile_model)
+    summarizer = _SUMMARIZER_CACHE.get(key)
+    if summarizer is None:
+        with _SUMMARIZER_CACHE_LOCK:
+            # Another thread may have loaded it while we waited for the lock
+            summarizer = _SUMMARIZER_CACHE.get(key)
+            if summarizer is None:
+                summarizer = DisasterSummarizer(
+                    model_name=model_name, use_t5=use_t5, use_onnx=use_onnx,
+                    precision=precision, compile_model=compile_model
+                )
+                _SUMMARIZER_CACHE[key] = summarizer
+    return summarizer
 
 
 # Convenience function for direct use
 def generate_all_summaries(
     text: str,
     model_name: str = "facebook/bart-large-cnn",
-    use_t5: bool = False
+    use_t5: bool = False,
+    summarizer: Optional[DisasterSummarizer] = None
 ) -> Tuple[str, str, str]:
     """
     Convenience function to generate all summary levels
@@ -266,16 +1116,55 @@ def generate_all_summaries(
         text: Input text
         model_name: Model to use
         use_t5: Whether to use T5 instead of BART
+        summarizer: Optional already-loaded summarizer; model_name/use_t5 are
+                    ignored when given. Default: the shared get_summarizer instance
         
     Returns:
         Tuple of (alert, short_summary, detailed_summary)
     """
-    summarizer = DisasterSummarizer(model_name=model_name, use_t5=use_t5)
+    if not text or len(text.strip()) == 0:
+        # Nothing to summarize: answer without loading (or even locating) a model
+        return ("No text provided for summarization.",) * len(SUMMARY_LEVELS)
+    if summarizer is None:
+        summarizer = get_summarizer(model_name, use_t5)
     return summarizer.generate_all_summaries(text)
 
 
+async def generate_all_summaries_async(
+    text: str,
+    model_name: str = "facebook/bart-large-cnn",
+    use_t5: bool = False,
+    summarizer: Optional[DisasterSummarizer] = None
+) -> Tuple[str, str, str]:
+    """
+    Awaitable generate_all_summaries that runs on the event loop's thread pool
+    
+    The three levels are still decoded in one batched pass inside a single
+    worker thread (torch releases the GIL during generate), so callers can
+    await several reports, or other I/O, concurrently without blocking the loop.
+    
+    Args:
+        text: Input text
+        model_name: Model to use
+        use_t5: Whether to use T5 instead of BART
+        summarizer: Optional already-loaded summarizer (see generate_all_summaries)
+        
+    Returns:
+        Tuple of (alert, short_summary, detailed_summary)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(generate_all_summaries, text, model_name, use_t5, summarizer)
+    )
+
+
 if __name__ == "__main__":
     # Test the module
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from utils.logging_config import setup_logging
+    setup_logging()
+    
     sample_text = """
     A severe earthquake measuring 7.2 on the Richter scale struck the northern region 
     early this morning at 3:45 AM. The epicenter was located 15 kilometers northeast 
@@ -3,22 +3,29 @@ Main Pipeline: Voice → Text → Multi-Level Summaries
 Connects speech recognition with summarization
 """
 
-import os
+import io
 import sys
 import logging
-from typing import Tuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, List, Sequence, Tuple, Optional, Union
 from pathlib import Path
 
 # Handle imports for both direct execution and module import
 try:
-    from src.models.speech_to_text import SpeechToText
-    from src.models.summarizer import DisasterSummarizer
+    from src.models.speech_to_text import get_stt_model
+    from src.models.summarizer import get_summarizer
+    from src.utils.logging_config import setup_logging
 except ImportError:
     # Fallback for direct execution from src/ directory
-    from models.speech_to_text import SpeechToText
-    from models.summarizer import DisasterSummarizer
+    from models.speech_to_text import get_stt_model
+    from models.summarizer import get_summarizer
+    from utils.logging_config import setup_logging
+    # config.py lives at the repository root
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -41,31 +48,41 @@ class VoiceToSummaryPipeline:
         """
         logger.info("Initializing Voice-to-Summary Pipeline...")
         
-        # Initialize components
-        self.stt = SpeechToText(model_size=whisper_model)
-        self.summarizer = DisasterSummarizer(
-            model_name=summarizer_model,
-            use_t5=use_t5
-        )
+        # Initialize components concurrently: Whisper (CTranslate2) and BART/T5
+        # (PyTorch) load independent weights and both release the GIL while doing so.
+        # Models are process-wide singletons, so later pipelines reuse them.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stt_future = executor.submit(get_stt_model, model_size=whisper_model)
+            summarizer_future = executor.submit(
+                get_summarizer,
+                model_name=summarizer_model,
+                use_t5=use_t5,
+                use_onnx=config.USE_ORT,
+                precision=config.PRECISION,
+                compile_model=config.COMPILE
+            )
+            self.stt = stt_future.result()
+            self.summarizer = summarizer_future.result()
         
         logger.info("Pipeline initialized successfully")
     
     def process_audio_file(
         self,
-        audio_path: str,
+        audio_path: Union[str, BinaryIO],
         language: Optional[str] = None
     ) -> Tuple[str, str, str, str]:
         """
         Process audio file through complete pipeline
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or a binary file-like object such as a
+                        Streamlit UploadedFile (passed through without copying to disk)
             language: Optional language code for transcription
             
         Returns:
             Tuple of (transcribed_text, alert, short_summary, detailed_summary)
         """
-        logger.info(f"Processing audio file: {audio_path}")
+        logger.info("Processing audio file: %s", getattr(audio_path, "name", audio_path))
         
         # Step 1: Speech to Text
         logger.info("Step 1: Transcribing audio...")
@@ -74,7 +91,7 @@ class VoiceToSummaryPipeline:
         if not transcribed_text or len(transcribed_text.strip()) == 0:
             raise ValueError("No text was transcribed from the audio file.")
         
-        logger.info(f"Transcription completed: {len(transcribed_text)} characters")
+        logger.info("Transcription completed: %d characters", len(transcribed_text))
         
         # Step 2: Generate summaries
         logger.info("Step 2: Generating summaries...")
@@ -84,6 +101,45 @@ class VoiceToSummaryPipeline:
         
         return transcribed_text, alert, short, detailed
     
+    def process_audio_files(
+        self,
+        audio_paths: Sequence[Union[str, BinaryIO]],
+        language: Optional[str] = None,
+        batch_size: Optional[int] = None
+    ) -> List[Tuple[str, str, str, str]]:
+        """
+        Process several audio files, summarizing all transcripts in shared batches
+        
+        Args:
+            audio_paths: Paths to audio files, or binary file-like objects
+            language: Optional language code for transcription
+            batch_size: Rows per summarization generate call (default: sized
+                        from free GPU memory)
+            
+        Returns:
+            One (transcribed_text, alert, short_summary, detailed_summary) per file,
+            in input order. Files without speech get the empty-input summaries.
+        """
+        logger.info("Processing %d audio files", len(audio_paths))
+        
+        # Step 1: Speech to Text
+        transcripts = []
+        for audio_path in audio_paths:
+            transcribed_text = self.stt.transcribe_audio(audio_path, language=language)
+            if not transcribed_text.strip():
+                logger.warning("No text was transcribed from %s", getattr(audio_path, "name", audio_path))
+            transcripts.append(transcribed_text)
+        
+        # Step 2: Generate summaries for every transcript together
+        logger.info("Step 2: Generating summaries for %d transcripts...", len(transcripts))
+        summaries = self.summarizer.generate_all_summaries_batch(transcripts, batch_size=batch_size)
+        
+        logger.info("Pipeline processing completed successfully")
+        return [
+            (transcribed_text, *levels)
+            for transcribed_text, levels in zip(transcripts, summaries)
+        ]
+    
     def process_audio_bytes(
         self,
         audio_bytes: bytes,
@@ -95,30 +151,45 @@ class VoiceToSummaryPipeline:
         
         Args:
             audio_bytes: Audio file as bytes
-            temp_suffix: File extension for temporary file
+            temp_suffix: Unused; kept for backwards compatibility (the container
+                         format is detected from the data itself)
             language: Optional language code for transcription
             
         Returns:
             Tuple of (transcribed_text, alert, short_summary, detailed_summary)
         """
-        import tempfile
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=temp_suffix) as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_path = tmp_file.name
-        
-        try:
-            return self.process_audio_file(tmp_path, language=language)
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        # PyAV decodes any container straight from memory, so no temporary
+        # file is written, reopened and unlinked
+        return self.process_audio_file(io.BytesIO(audio_bytes), language=language)
+
+
+@lru_cache(maxsize=4)
+def get_pipeline(
+    whisper_model: str = "base",
+    summarizer_model: str = "facebook/bart-large-cnn",
+    use_t5: bool = False
+) -> VoiceToSummaryPipeline:
+    """
+    Return a shared VoiceToSummaryPipeline for these models, building it on first use
+    
+    Args:
+        whisper_model: Whisper model size
+        summarizer_model: Summarization model name
+        use_t5: Whether to use T5
+        
+    Returns:
+        Cached VoiceToSummaryPipeline instance
+    """
+    return VoiceToSummaryPipeline(
+        whisper_model=whisper_model,
+        summarizer_model=summarizer_model,
+        use_t5=use_t5
+    )
 
 
 # Convenience function for direct use
 def voice_to_summary(
-    audio_file: Union[str, bytes],
+    audio_file: Union[str, bytes, BinaryIO],
     whisper_model: str = "base",
     summarizer_model: str = "facebook/bart-large-cnn",
     use_t5: bool = False,
@@ -128,7 +199,7 @@ def voice_to_summary(
     Convenience function to process audio file
     
     Args:
-        audio_file: Path to audio file or raw audio bytes
+        audio_file: Path to audio file, raw audio bytes or a binary file-like object
         whisper_model: Whisper model size
         summarizer_model: Summarization model name
         use_t5: Whether to use T5
@@ -137,11 +208,7 @@ def voice_to_summary(
     Returns:
         Tuple of (transcribed_text, alert, short_summary, detailed_summary)
     """
-    pipeline = VoiceToSummaryPipeline(
-        whisper_model=whisper_model,
-        summarizer_model=summarizer_model,
-        use_t5=use_t5
-    )
+    pipeline = get_pipeline(whisper_model, summarizer_model, use_t5)
     
     if isinstance(audio_file, bytes):
         return pipeline.process_audio_bytes(audio_file, language=language)
@@ -153,7 +220,20 @@ if __name__ == "__main__":
     # Test the pipeline
     import sys
     
-    if len(sys.argv) > 1:
+    setup_logging()
+    
+    if len(sys.argv) > 2:
+        # Several files: transcripts are summarized together in batches
+        results = get_pipeline().process_audio_files(sys.argv[1:])
+        for audio_file, (transcribed, alert, short, detailed) in zip(sys.argv[1:], results):
+            print("\n" + "="*60)
+            print(f"🎙️ {audio_file}")
+            print("="*60)
+            print(f"📝 TRANSCRIBED TEXT:\n{transcribed}\n")
+            print(f"🔔 ALERT (1-line):\n{alert}\n")
+            print(f"📰 SHORT PUBLIC SUMMARY:\n{short}\n")
+            print(f"🚨 DETAILED RESPONSE SUMMARY:\n{detailed}")
+    elif len(sys.argv) > 1:
         audio_file = sys.argv[1]
         print(f"Processing: {audio_file}")
         
@@ -179,5 +259,5 @@ if __name__ == "__main__":
         print("="*60)
         print(detailed)
     else:
-        print("Usage: python pipeline.py <audio_file>")
+        print("Usage: python pipeline.py <audio_file> [<audio_file> ...]")
 
@@ -3,20 +3,251 @@ Evaluation Module for Summarization Quality
 Includes ROUGE metrics and human evaluation support
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import functools
+import importlib.util
 import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
-try:
-    from rouge_score import rouge_scorer
-    ROUGE_AVAILABLE = True
-except ImportError:
-    ROUGE_AVAILABLE = False
-    logging.warning("rouge_score not installed. Install with: pip install rouge-score")
+import numpy as np
+
+# rouge_score (and the nltk stack under it) is imported when a scorer is first built
+ROUGE_AVAILABLE = importlib.util.find_spec("rouge_score") is not None
+
+# Optional: numba compiles the n-gram/LCS kernels on first use (cached on disk);
+# without it scoring falls back to rouge_score's Counter/list implementation
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+if not ROUGE_AVAILABLE:
+    logger.warning("rouge_score not installed. Install with: pip install rouge-score")
+
+_ROUGE_TYPES = ('rouge1', 'rouge2', 'rougeL')
+
+# Flat (f, p, r) order per ROUGE type, matching SummaryMetrics field order
+_METRIC_KEYS = (
+    'rouge_1_f', 'rouge_1_p', 'rouge_1_r',
+    'rouge_2_f', 'rouge_2_p', 'rouge_2_r',
+    'rouge_l_f', 'rouge_l_p', 'rouge_l_r',
+)
+
+# Below this many pairs, process start-up and pickling cost more than the
+# scoring itself, so evaluate_batch stays in-process
+_PARALLEL_MIN_PAIRS = 64
+_PARALLEL_CHUNKSIZE = 32
+
+# Distinct texts whose tokens are kept; grid evaluations reuse the same
+# references (and often candidates) across systems
+_TOKEN_CACHE_SIZE = 4096
+# Distinct words whose Porter stem is kept; stemming dominates tokenization
+# and the vocabulary repeats far more often than whole texts do
+_STEM_CACHE_SIZE = 65536
+
+# Per-process evaluator for _score_pair, built lazily on first use in each worker
+_WORKER_EVALUATOR = None
+
+
+class _CachedStemmer:
+    """The Porter stemmer rouge_score's DefaultTokenizer uses, memoized per word"""
+    
+    def __init__(self):
+        from nltk.stem import porter
+        self.stem = functools.lru_cache(maxsize=_STEM_CACHE_SIZE)(porter.PorterStemmer().stem)
+
+
+class _CachedTokenizer:
+    """rouge_score DefaultTokenizer that memoizes lowercasing + Porter stemming per text"""
+    
+    def __init__(self, use_stemmer: bool = False):
+        # rouge_score's own tokenize (precompiled regexes), with a per-word stem cache
+        # so texts that miss the per-text cache still skip re-stemming known words
+        from rouge_score import tokenize
+        stemmer = _CachedStemmer() if use_stemmer else None
+        # Per-instance caches so each scorer (and worker) owns its entries
+        self.tokenize = functools.lru_cache(maxsize=_TOKEN_CACHE_SIZE)(
+            functools.partial(tokenize.tokenize, stemmer=stemmer)
+        )
+
+
+def _build_scorer(tokenizer: _CachedTokenizer):
+    """Build the stemmed rouge1/rouge2/rougeL scorer around a cached tokenizer"""
+    from rouge_score import rouge_scorer
+    return rouge_scorer.RougeScorer(
+        list(_ROUGE_TYPES),
+        use_stemmer=True,
+        tokenizer=tokenizer
+    )
+
+
+def _count_ngram_overlap(a, b, n, vocab_size):
+    """
+    Clipped n-gram matches between two token-id arrays (numba kernel)
+    
+    Each n-gram is packed into one int64 key (base vocab_size), both key arrays
+    are sorted, and a single merge pass counts sum(min(count_a, count_b)).
+    
+    Args:
+        a: int32 token ids of the reference
+        b: int32 token ids of the candidate
+        n: N-gram order (keys fit in int64 for n <= 2 with any int32 vocabulary)
+        vocab_size: Exclusive upper bound of the ids in a and b
+        
+    Returns:
+        Tuple of (matches, n-grams in a, n-grams in b)
+    """
+    count_a = max(a.shape[0] - n + 1, 0)
+    count_b = max(b.shape[0] - n + 1, 0)
+    keys_a = np.empty(count_a, dtype=np.int64)
+    keys_b = np.empty(count_b, dtype=np.int64)
+    for i in range(count_a):
+        key = 0
+        for j in range(n):
+            # int() widens the int32 element so the packed key never wraps at 2**31
+            key = key * vocab_size + int(a[i + j])
+        keys_a[i] = key
+    for i in range(count_b):
+        key = 0
+        for j in range(n):
+            key = key * vocab_size + int(b[i + j])
+        keys_b[i] = key
+    keys_a.sort()
+    keys_b.sort()
+    
+    matches = 0
+    i = 0
+    j = 0
+    while i < count_a and j < count_b:
+        if keys_a[i] == keys_b[j]:
+            matches += 1
+            i += 1
+            j += 1
+        elif keys_a[i] < keys_b[j]:
+            i += 1
+        else:
+            j += 1
+    return matches, count_a, count_b
+
+
+def _lcs_len(a, b):
+    """
+    Longest common subsequence length of two token-id arrays (numba kernel)
+    
+    Args:
+        a: int32 token ids of the reference
+        b: int32 token ids of the candidate
+        
+    Returns:
+        LCS length
+    """
+    m = a.shape[0]
+    n = b.shape[0]
+    table = np.empty((m + 1, n + 1), dtype=np.int32)
+    table[0, :] = 0
+    table[:, 0] = 0
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if a[i - 1] == b[j - 1]:
+                table[i, j] = table[i - 1, j - 1] + 1
+            elif table[i - 1, j] >= table[i, j - 1]:
+                table[i, j] = table[i - 1, j]
+            else:
+                table[i, j] = table[i, j - 1]
+    return table[m, n]
+
+
+@functools.lru_cache(maxsize=None)
+def _rouge_kernels():
+    """
+    The overlap and LCS kernels: compiled with numba (or loaded from its on-disk
+    cache) when installed, otherwise the same functions run as plain Python
+    """
+    if not NUMBA_AVAILABLE:
+        return _count_ngram_overlap, _lcs_len
+    import numba
+    return (
+        numba.njit(cache=True)(_count_ngram_overlap),
+        numba.njit(cache=True)(_lcs_len),
+    )
+
+
+def _fmeasure(precision: float, recall: float) -> float:
+    """F1 exactly as rouge_score.scoring.fmeasure computes it"""
+    if precision + recall > 0:
+        return 2 * precision * recall / (precision + recall)
+    return 0.0
+
+
+def _scores_from_ids(reference: np.ndarray, candidate: np.ndarray) -> Tuple[float, ...]:
+    """
+    ROUGE-1/2/L for token-id arrays using the n-gram overlap and LCS kernels
+    
+    Mirrors rouge_score's arithmetic, so results match RougeScorer.score exactly.
+    
+    Args:
+        reference: int32 token ids of the reference summary
+        candidate: int32 token ids of the candidate summary (same vocabulary)
+        
+    Returns:
+        Tuple of nine scores in _METRIC_KEYS order
+    """
+    count_ngram_overlap, lcs_len = _rouge_kernels()
+    vocab_size = max(int(reference.max(initial=0)), int(candidate.max(initial=0))) + 1
+    
+    scores = []
+    for n in (1, 2):
+        matches, reference_count, candidate_count = count_ngram_overlap(reference, candidate, n, vocab_size)
+        precision = matches / max(candidate_count, 1)
+        recall = matches / max(reference_count, 1)
+        scores.extend((_fmeasure(precision, recall), precision, recall))
+    
+    if reference.size == 0 or candidate.size == 0:
+        scores.extend((0.0, 0.0, 0.0))
+    else:
+        lcs = int(lcs_len(reference, candidate))
+        precision = lcs / candidate.size
+        recall = lcs / reference.size
+        scores.extend((_fmeasure(precision, recall), precision, recall))
+    return tuple(scores)
+
+
+def _init_worker() -> None:
+    """ROUGE workers never touch the GPU; hide it so nothing they import initializes CUDA"""
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+
+def _flatten_scores(scores) -> Tuple[float, ...]:
+    """Flatten a RougeScorer result into the _METRIC_KEYS order"""
+    return tuple(
+        value
+        for rouge_type in _ROUGE_TYPES
+        for value in (
+            scores[rouge_type].fmeasure,
+            scores[rouge_type].precision,
+            scores[rouge_type].recall,
+        )
+    )
+
+
+def _score_pair(reference: str, candidate: str) -> Tuple[float, ...]:
+    """
+    Score one pair with this process's scorer (picklable pool entry point)
+    
+    Args:
+        reference: Reference (ground truth) summary
+        candidate: Generated summary to evaluate
+        
+    Returns:
+        Tuple of nine scores in _METRIC_KEYS order
+    """
+    global _WORKER_EVALUATOR
+    if _WORKER_EVALUATOR is None:
+        _WORKER_EVALUATOR = SummarizationEvaluator()
+    return _WORKER_EVALUATOR._score(reference, candidate)
+
 
 @dataclass
 class SummaryMetrics:
@@ -38,13 +269,76 @@ class SummarizationEvaluator:
     def __init__(self):
         """Initialize evaluator with ROUGE scorer"""
         if ROUGE_AVAILABLE:
-            self.rouge_scorer = rouge_scorer.RougeScorer(
-                ['rouge1', 'rouge2', 'rougeL'],
-                use_stemmer=True
-            )
+            self._tokenizer = _CachedTokenizer(use_stemmer=True)
+            self.rouge_scorer = _build_scorer(self._tokenizer)
         else:
             self.rouge_scorer = None
             logger.warning("ROUGE scorer not available")
+        # Token -> id map for encode(), grown on demand until reset_vocab();
+        # compute_rouge / evaluate_batch use a throwaway per-pair map instead
+        self._vocab: Dict[str, int] = {}
+        self._vocab_lock = threading.Lock()
+    
+    def _encode_with(self, text: str, vocab: Dict[str, int]) -> np.ndarray:
+        """Tokenize text the way ROUGE does and map the tokens to ids in vocab (grown in place)"""
+        return np.array(
+            [vocab.setdefault(token, len(vocab)) for token in self._tokenizer.tokenize(text)],
+            dtype=np.int32
+        )
+    
+    def encode(self, text: str) -> np.ndarray:
+        """
+        Tokenize text the way ROUGE does (lowercase, stemmed) and map it to token ids
+        
+        Ids come from a vocabulary shared by all texts encoded with this evaluator,
+        so encoded references can be reused across candidates in compute_rouge_ids.
+        The vocabulary only grows (one entry per distinct stemmed token); call
+        reset_vocab() between unrelated corpora in long-lived evaluators.
+        
+        Args:
+            text: Text to encode
+            
+        Returns:
+            int32 array of token ids
+        """
+        if not ROUGE_AVAILABLE:
+            raise RuntimeError("rouge_score not installed. Install with: pip install rouge-score")
+        with self._vocab_lock:
+            return self._encode_with(text, self._vocab)
+    
+    def reset_vocab(self) -> None:
+        """Forget the encode() vocabulary; ids encoded before the reset must not be mixed with later ones"""
+        with self._vocab_lock:
+            self._vocab = {}
+    
+    def compute_rouge_ids(
+        self,
+        reference_ids: np.ndarray,
+        candidate_ids: np.ndarray
+    ) -> SummaryMetrics:
+        """
+        Compute ROUGE scores between pre-encoded reference and candidate summaries
+        
+        Args:
+            reference_ids: Token ids of the reference summary (see encode)
+            candidate_ids: Token ids of the candidate summary, same vocabulary
+            
+        Returns:
+            SummaryMetrics object with ROUGE scores
+        """
+        return SummaryMetrics(*_scores_from_ids(
+            np.asarray(reference_ids, dtype=np.int32),
+            np.asarray(candidate_ids, dtype=np.int32),
+        ))
+    
+    def _score(self, reference: str, candidate: str) -> Tuple[float, ...]:
+        """Nine scores for one pair in _METRIC_KEYS order, via the numba kernels when installed"""
+        if NUMBA_AVAILABLE:
+            # Per-pair vocabulary: ids only need to agree between these two texts
+            vocab = {}
+            return _scores_from_ids(self._encode_with(reference, vocab), self._encode_with(candidate, vocab))
+        # The plain-Python kernels are slower than rouge_score's own Counter-based scoring
+        return _flatten_scores(self.rouge_scorer.score(reference, candidate))
     
     def compute_rouge(
         self,
@@ -65,19 +359,7 @@ class SummarizationEvaluator:
             logger.warning("ROUGE not available, returning empty metrics")
             return SummaryMetrics()
         
-        scores = self.rouge_scorer.score(reference, candidate)
-        
-        metrics = SummaryMetrics(
-            rouge_1_f=scores['rouge1'].fmeasure,
-            rouge_1_p=scores['rouge1'].precision,
-            rouge_1_r=scores['rouge1'].recall,
-            rouge_2_f=scores['rouge2'].fmeasure,
-            rouge_2_p=scores['rouge2'].precision,
-            rouge_2_r=scores['rouge2'].recall,
-            rouge_l_f=scores['rougeL'].fmeasure,
-            rouge_l_p=scores['rougeL'].precision,
-            rouge_l_r=scores['rougeL'].recall,
-        )
+        metrics = SummaryMetrics(*self._score(reference, candidate))
         
         return metrics
     
@@ -99,23 +381,31 @@ class SummarizationEvaluator:
         if len(references) != len(candidates):
             raise ValueError("References and candidates must have same length")
         
-        all_metrics = []
-        for ref, cand in zip(references, candidates):
-            metrics = self.compute_rouge(ref, cand)
-            all_metrics.append(metrics)
-        
-        # Compute averages
-        avg_metrics = {
-            'rouge_1_f': sum(m.rouge_1_f for m in all_metrics) / len(all_metrics),
-            'rouge_1_p': sum(m.rouge_1_p for m in all_metrics) / len(all_metrics),
-            'rouge_1_r': sum(m.rouge_1_r for m in all_metrics) / len(all_metrics),
-            'rouge_2_f': sum(m.rouge_2_f for m in all_metrics) / len(all_metrics),
-            'rouge_2_p': sum(m.rouge_2_p for m in all_metrics) / len(all_metrics),
-            'rouge_2_r': sum(m.rouge_2_r for m in all_metrics) / len(all_metrics),
-            'rouge_l_f': sum(m.rouge_l_f for m in all_metrics) / len(all_metrics),
-            'rouge_l_p': sum(m.rouge_l_p for m in all_metrics) / len(all_metrics),
-            'rouge_l_r': sum(m.rouge_l_r for m in all_metrics) / len(all_metrics),
-        }
+        if not references:
+            raise ValueError("At least one reference/candidate pair is required")
+        
+        if not ROUGE_AVAILABLE or self.rouge_scorer is None:
+            logger.warning("ROUGE not available, returning empty metrics")
+            return dict.fromkeys(_METRIC_KEYS, 0.0)
+        
+        # Running sum over the nine metrics; no per-pair results are kept
+        sums = np.zeros(len(_METRIC_KEYS), dtype=np.float64)
+        
+        if len(references) >= _PARALLEL_MIN_PAIRS and (os.cpu_count() or 1) > 1:
+            # Pairs are independent and ROUGE is pure-Python CPU work, so
+            # spread them across processes rather than threads (GIL)
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as executor:
+                rows = executor.map(
+                    _score_pair, references, candidates,
+                    chunksize=_PARALLEL_CHUNKSIZE
+                )
+                for row in rows:
+                    sums += row
+        else:
+            for ref, cand in zip(references, candidates):
+                sums += self._score(ref, cand)
+        
+        avg_metrics = dict(zip(_METRIC_KEYS, (sums / len(references)).tolist()))
         
         return avg_metrics
     
@@ -179,6 +469,9 @@ def human_evaluation_template(
 
 
 if __name__ == "__main__":
+    from logging_config import setup_logging
+    setup_logging()
+    
     # Test evaluation
     if ROUGE_AVAILABLE:
         evaluator = SummarizationEvaluator()
@@ -20,12 +20,23 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once and padded inside the color codes so the
+        # '%(levelname)-8s' column stays aligned (escape codes count towards the width)
+        self._colored = {
+            logging.getLevelName(name): f"{color}{name:<8}{self.RESET}"
+            for name, color in self.COLORS.items()
+        }
+    
     def format(self, record):
-        # Add color to the level name
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        
-        return super().format(record)
+        # Add color to the level name, restoring it for any other handler
+        levelname = record.levelname
+        record.levelname = self._colored.get(record.levelno, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(level=logging.INFO, use_colors=True):
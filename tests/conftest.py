@@ -0,0 +1,73 @@
+"""
+Shared fixtures for the test suite
+"""
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import pytest
+
+# Tests only check that summaries are produced, so load int8 weights (int8 ONNX
+# Runtime or PyTorch dynamic quantization on CPU, bitsandbytes on GPU); export
+# DISASTER_SUMM_QUANT=fp32 (or another precision) to test full precision
+os.environ.setdefault("DISASTER_SUMM_QUANT", "int8")
+
+# Background load of the session summarizer, started once collection is done
+_SUMMARIZER_LOADER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summarizer-prefetch")
+_SUMMARIZER_FUTURE: Optional[Future] = None
+
+
+def _load_summarizer():
+    """Load (or export, with ONNX Runtime) and warm up the shared summarizer"""
+    from src.models.summarizer import ORT_AVAILABLE, get_summarizer
+    
+    summarizer = get_summarizer(use_onnx=ORT_AVAILABLE)
+    summarizer.warmup()
+    return summarizer
+
+
+def pytest_collection_finish(session):
+    """
+    Start loading the summarizer once collection shows a selected test needs it
+    
+    Weight loading and warm-up then overlap the tests that run before the
+    first summarization test instead of stalling it. Runs after -k/-m
+    deselection, so evaluation-only runs never load the model; nothing is
+    loaded for --collect-only, and xdist controllers (no items) skip it too.
+    """
+    global _SUMMARIZER_FUTURE
+    if session.config.option.collectonly:
+        return
+    if any("summarizer" in getattr(item, "fixturenames", ()) for item in session.items):
+        _SUMMARIZER_FUTURE = _SUMMARIZER_LOADER.submit(_load_summarizer)
+
+
+def pytest_sessionfinish(session):
+    """Drop a prefetch that has not started yet so it cannot delay interpreter exit"""
+    _SUMMARIZER_LOADER.shutdown(wait=False, cancel_futures=True)
+
+
+@pytest.fixture(scope="session")
+def summarizer():
+    """
+    One DisasterSummarizer for the whole session (weights are loaded once)
+    
+    With optimum[onnxruntime] installed the ONNX Runtime backend is used: the
+    first run exports the model to the on-disk ONNX cache, later runs and
+    xdist workers only load the saved graphs. The model is warmed up once so
+    CUDA/cuDNN kernel selection is not billed to whichever test runs first.
+    Loading starts in the background after collection (pytest_collection_finish);
+    load errors are raised here.
+    """
+    if _SUMMARIZER_FUTURE is None:
+        return _load_summarizer()
+    return _SUMMARIZER_FUTURE.result()
+
+
+@pytest.fixture(scope="session")
+def evaluator():
+    """One SummarizationEvaluator for the whole session (scorer, stemmer and caches built once)"""
+    from src.utils.evaluation import SummarizationEvaluator
+    
+    return SummarizationEvaluator()
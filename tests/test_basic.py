@@ -3,48 +3,109 @@ Basic tests for the Voice Disaster Report Summarization System
 Run with: pytest tests/test_basic.py
 """
 
-import pytest
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+import pytest
+
+if __name__ == "__main__":
+    # Run as a script: make the repository root importable (pytest itself gets it
+    # from pyproject.toml's pythonpath)
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.models.summarizer import DisasterSummarizer, generate_all_summaries
-from src.utils.evaluation import SummarizationEvaluator
+from src.utils.evaluation import NUMBA_AVAILABLE, ROUGE_AVAILABLE, SummarizationEvaluator
+
+# (reference, candidate) pairs with ROUGE edge cases: plain text, repeated n-grams
+# (clipped counts), empty texts and single tokens
+ROUGE_PAIRS = [
+    ("A severe earthquake struck the region, causing damage and casualties.",
+     "An earthquake hit the area, resulting in damage and injuries."),
+    ("flood flood flood warning", "flood warning flood warning flood flood"),
+    ("", "Flooding reported downtown."),
+    ("Flooding reported downtown.", ""),
+    ("", ""),
+    ("evacuate", "evacuate"),
+    ("evacuate", "shelter"),
+]
+
+
+def rouge_score_reference(reference: str, candidate: str):
+    """Nine scores (SummaryMetrics field order) from rouge_score itself"""
+    from rouge_score import rouge_scorer
+    
+    scores = rouge_scorer.RougeScorer(["rouge1", "rouge2", "rougeL"], use_stemmer=True).score(reference, candidate)
+    return tuple(
+        value
+        for rouge_type in ("rouge1", "rouge2", "rougeL")
+        for value in (scores[rouge_type].fmeasure, scores[rouge_type].precision, scores[rouge_type].recall)
+    )
+
+
+# Reports of different disaster types and lengths, summarized together in one batch
+SAMPLE_REPORTS = [
+    """
+    A severe earthquake measuring 7.2 on the Richter scale struck the northern region 
+    early this morning. Initial reports indicate significant structural damage to 
+    residential buildings. Emergency services have been deployed. At least 50 people 
+    have been reported injured, with 5 confirmed fatalities. Hospitals are on high alert.
+    """,
+    """
+    Heavy rainfall over the past 48 hours has caused the river to burst its banks, 
+    flooding low-lying neighbourhoods on the east side of the city. Around 2,000 
+    residents have been evacuated to temporary shelters. Several roads and two bridges 
+    are closed, and drinking water supplies are at risk of contamination.
+    """,
+    """
+    A wildfire driven by strong winds has burned more than 10,000 acres near the 
+    foothills. Firefighters are struggling to contain the blaze, which is 15 percent 
+    contained. Mandatory evacuation orders are in place for three towns, and air 
+    quality alerts have been issued across the region.
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+def batch_summaries(summarizer):
+    """All summary levels for SAMPLE_REPORTS, generated in one batched call"""
+    return summarizer.generate_all_summaries_batch(SAMPLE_REPORTS)
 
 
 class TestSummarization:
     """Test summarization functionality"""
     
-    def test_summarizer_initialization(self):
+    def test_summarizer_initialization(self, summarizer):
         """Test that summarizer can be initialized"""
-        summarizer = DisasterSummarizer()
-        assert summarizer is not None
+        assert isinstance(summarizer, DisasterSummarizer)
         assert summarizer.model_name is not None
+        # BART/T5 ship Rust-backed tokenizers; the slow Python fallback would dominate short inputs
+        assert summarizer.tokenizer.is_fast
     
-    def test_text_summarization(self):
+    def test_text_summarization(self, summarizer):
         """Test basic text summarization"""
-        sample_text = """
-        A severe earthquake measuring 7.2 on the Richter scale struck the northern region 
-        early this morning. Initial reports indicate significant structural damage to 
-        residential buildings. Emergency services have been deployed. At least 50 people 
-        have been reported injured, with 5 confirmed fatalities. Hospitals are on high alert.
-        """
+        alert, short, detailed = generate_all_summaries(SAMPLE_REPORTS[0], summarizer=summarizer)
         
-        alert, short, detailed = generate_all_summaries(sample_text)
+        lengths = np.fromiter((len(s) for s in (alert, short, detailed)), dtype=np.int64)
         
         # Check that summaries are generated
-        assert len(alert) > 0, "Alert summary should not be empty"
-        assert len(short) > 0, "Short summary should not be empty"
-        assert len(detailed) > 0, "Detailed summary should not be empty"
+        assert (lengths > 0).all(), f"Summaries should not be empty (alert, short, detailed lengths: {lengths})"
         
         # Check that summaries are different lengths (detailed > short > alert)
-        assert len(detailed) >= len(short), "Detailed should be longer than short"
-        assert len(short) >= len(alert), "Short should be longer than alert"
+        assert (np.diff(lengths) >= 0).all(), f"Expected alert <= short <= detailed lengths, got {lengths}"
+    
+    @pytest.mark.parametrize("index", range(len(SAMPLE_REPORTS)))
+    def test_batch_summarization(self, batch_summaries, index):
+        """Test batched summarization of several reports"""
+        assert len(batch_summaries) == len(SAMPLE_REPORTS)
+        
+        lengths = np.fromiter((len(s) for s in batch_summaries[index]), dtype=np.int64)
+        
+        assert (lengths > 0).all(), f"Summaries should not be empty (alert, short, detailed lengths: {lengths})"
+        assert (np.diff(lengths) >= 0).all(), f"Expected alert <= short <= detailed lengths, got {lengths}"
     
     def test_empty_text(self):
-        """Test handling of empty text"""
+        """Test handling of empty text (answered without loading a model)"""
         alert, short, detailed = generate_all_summaries("")
         
         # Should handle gracefully
@@ -56,35 +117,51 @@ class TestSummarization:
 class TestEvaluation:
     """Test evaluation functionality"""
     
-    def test_evaluator_initialization(self):
+    def test_evaluator_initialization(self, evaluator):
         """Test that evaluator can be initialized"""
-        evaluator = SummarizationEvaluator()
-        assert evaluator is not None
+        assert isinstance(evaluator, SummarizationEvaluator)
     
-    def test_rouge_computation(self):
+    @pytest.mark.skipif(not ROUGE_AVAILABLE, reason="ROUGE not available (pip install rouge-score)")
+    def test_rouge_computation(self, evaluator):
         """Test ROUGE score computation"""
-        try:
-            evaluator = SummarizationEvaluator()
-            
-            reference = "A severe earthquake struck the region, causing damage and casualties."
-            candidate = "An earthquake hit the area, resulting in damage and injuries."
-            
-            metrics = evaluator.compute_rouge(reference, candidate)
-            
-            # Check that metrics are computed
-            assert metrics.rouge_1_f >= 0.0
-            assert metrics.rouge_1_f <= 1.0
-            assert metrics.rouge_2_f >= 0.0
-            assert metrics.rouge_2_f <= 1.0
-            assert metrics.rouge_l_f >= 0.0
-            assert metrics.rouge_l_f <= 1.0
-            
-        except Exception as e:
-            # ROUGE might not be available, skip test
-            pytest.skip(f"ROUGE not available: {str(e)}")
+        reference = "A severe earthquake struck the region, causing damage and casualties."
+        candidate = "An earthquake hit the area, resulting in damage and injuries."
+        
+        metrics = evaluator.compute_rouge(reference, candidate)
+        
+        # Check that metrics are computed
+        assert metrics.rouge_1_f >= 0.0
+        assert metrics.rouge_1_f <= 1.0
+        assert metrics.rouge_2_f >= 0.0
+        assert metrics.rouge_2_f <= 1.0
+        assert metrics.rouge_l_f >= 0.0
+        assert metrics.rouge_l_f <= 1.0
+    
+    @pytest.mark.skipif(not (ROUGE_AVAILABLE and NUMBA_AVAILABLE), reason="numba ROUGE kernels not available (pip install .[fast-rouge])")
+    @pytest.mark.parametrize("reference, candidate", ROUGE_PAIRS)
+    def test_rouge_kernels_match_rouge_score(self, evaluator, reference, candidate):
+        """Test that the numba n-gram overlap / LCS kernels reproduce rouge_score exactly"""
+        assert evaluator._score(reference, candidate) == rouge_score_reference(reference, candidate)
+    
+    @pytest.mark.skipif(not ROUGE_AVAILABLE, reason="ROUGE not available (pip install rouge-score)")
+    @pytest.mark.parametrize("reference, candidate", ROUGE_PAIRS)
+    @pytest.mark.filterwarnings("error::RuntimeWarning")  # e.g. wrapped n-gram key arithmetic
+    def test_rouge_from_token_ids(self, evaluator, reference, candidate):
+        """Test that pre-encoded token ids give the same ROUGE scores as rouge_score"""
+        reference_ids = evaluator.encode(reference)
+        candidate_ids = evaluator.encode(candidate)
+        assert reference_ids.dtype == np.int32
+        
+        expected = rouge_score_reference(reference, candidate)
+        assert tuple(vars(evaluator.compute_rouge_ids(reference_ids, candidate_ids)).values()) == expected
+        
+        # Large ids (n-gram keys beyond int32) must score the same
+        offset = 70_000
+        metrics = evaluator.compute_rouge_ids(reference_ids + offset, candidate_ids + offset)
+        assert tuple(vars(metrics).values()) == expected
 
 
 if __name__ == "__main__":
-    # Run basic tests
-    pytest.main([__file__, "-v"])
+    # Run basic tests (no cache plugin or header: quicker repeated dev-loop runs)
+    pytest.main([__file__, "-q", "-p", "no:cacheprovider", "--no-header"])
 